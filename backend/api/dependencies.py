@@ -15,20 +15,36 @@ class ServiceContainer:
     _semantic_service: Optional[SemanticService] = None
     _cognate_service: Optional[CognateService] = None
     _phylo_service: Optional[PhyloService] = None
+    _lazy: bool = False
     
     @classmethod
-    def initialize(cls) -> None:
+    def initialize(cls, lazy: bool = False) -> None:
         """Initialize all services at application startup.
         
         This loads ML models and linguistic resources once,
         avoiding expensive re-initialization on every request.
+        With lazy=True the semantic model, and the cognate service
+        that depends on it, are loaded on first access instead.
         """
         print("Initializing services...")
+        cls._lazy = lazy
         
         # Initialize phonetic service (loads panphon, epitran)
         print("  - Loading phonetic analysis resources...")
         cls._phonetic_service = PhoneticService()
         
+        if not lazy:
+            cls._initialize_semantic()
+        
+        # Initialize phylo service (R integration optional)
+        print("  - Initializing phylogenetic service...")
+        cls._phylo_service = PhyloService(use_r=False)  # Enable with use_r=True when R service running
+        
+        print("Services initialized successfully!")
+    
+    @classmethod
+    def _initialize_semantic(cls) -> None:
+        """Load the semantic model and the cognate service built on it."""
         # Initialize semantic service (loads transformer model - expensive!)
         print("  - Loading semantic transformer model (this may take a moment)...")
         cls._semantic_service = SemanticService()
@@ -39,12 +55,6 @@ class ServiceContainer:
             phonetic=cls._phonetic_service,
             semantic=cls._semantic_service
         )
-        
-        # Initialize phylo service (R integration optional)
-        print("  - Initializing phylogenetic service...")
-        cls._phylo_service = PhyloService(use_r=False)  # Enable with use_r=True when R service running
-        
-        print("Services initialized successfully!")
     
     @classmethod
     def get_phonetic_service(cls) -> PhoneticService:
@@ -59,6 +69,8 @@ class ServiceContainer:
     @classmethod
     def get_semantic_service(cls) -> SemanticService:
         """Get singleton semantic service instance."""
+        if cls._semantic_service is None and cls._lazy:
+            cls._initialize_semantic()
         if cls._semantic_service is None:
             raise RuntimeError(
                 "SemanticService not initialized. "
@@ -69,6 +81,8 @@ class ServiceContainer:
     @classmethod
     def get_cognate_service(cls) -> CognateService:
         """Get singleton cognate service instance."""
+        if cls._cognate_service is None and cls._lazy:
+            cls._initialize_semantic()
         if cls._cognate_service is None:
             raise RuntimeError(
                 "CognateService not initialized. "
@@ -95,6 +109,7 @@ class ServiceContainer:
         cls._semantic_service = None
         cls._cognate_service = None
         cls._phylo_service = None
+        cls._lazy = False
         print("Services cleaned up!")
 
 
@@ -20,6 +20,7 @@ from backend.services.embedding import OptimizedEmbeddingService
 from backend.services.concepts import ConceptAligner
 from backend.storage.accelerated import AcceleratedBatchProcessor, PipelineConfig
 from backend.storage.cache import EmbeddingCache, ConceptCache
+from backend.storage.repositories import init_connection
 from backend.observ import get_logger
 
 logger = get_logger(__name__)
@@ -36,7 +37,8 @@ async def get_pool():
         min_size=10,  # Increased for parallel writers
         max_size=50,  # Higher concurrency
         command_timeout=300,  # 5 min timeout
-        max_cached_statement_lifetime=3600  # Cache prepared statements
+        max_cached_statement_lifetime=3600,  # Cache prepared statements
+        init=init_connection
     )
 
 
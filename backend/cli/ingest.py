@@ -15,6 +15,7 @@ sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from config import get_settings
 from storage.ingest import IngestService, IngestConfig
+from storage.repositories import init_connection
 
 
 async def ingest_command(args):
@@ -25,7 +26,8 @@ async def ingest_command(args):
     pool = await asyncpg.create_pool(
         settings.database_url,
         min_size=5,
-        max_size=20  # Increased for parallel workers
+        max_size=20,  # Increased for parallel workers
+        init=init_connection
     )
     
     # Configure accelerated ingestion
@@ -71,7 +73,8 @@ async def reprocess_command(args):
     pool = await asyncpg.create_pool(
         settings.database_url,
         min_size=5,
-        max_size=20  # Increased for parallel workers
+        max_size=20,  # Increased for parallel workers
+        init=init_connection
     )
     
     # Configure accelerated reprocessing
@@ -105,7 +108,8 @@ async def validate_command(args):
     pool = await asyncpg.create_pool(
         settings.database_url,
         min_size=1,
-        max_size=5
+        max_size=5,
+        init=init_connection
     )
     
     validator = ValidatorFactory.standard_entry_validator()
@@ -28,8 +28,8 @@ from pathlib import Path
 from backend.interop.perl_client import PerlParserClient
 from backend.services.optimized import OptimizedServiceContainer
 from backend.storage.accelerated import AcceleratedBatchProcessor, PipelineConfig
+from backend.storage._hash import _checksum
 from backend.observ import get_logger
-import hashlib
 import json
 from datetime import datetime
 
@@ -318,7 +318,7 @@ async def _store_raw_entries(pool, entries: list[dict], source_id: str, file_pat
     """Store raw entries in database."""
     async with pool.acquire() as conn:
         for i, entry in enumerate(entries):
-            checksum = hashlib.sha256(json.dumps(entry, sort_keys=True).encode()).hexdigest()
+            checksum = _checksum(entry)
             
             await conn.execute(
                 """
@@ -20,6 +20,7 @@ from backend.services.concepts import ConceptAligner
 from backend.services.unified import UnifiedSimilarityService
 from backend.services.visualize import VisualizationReducer, ConceptVisualizer
 from backend.storage.batch import BatchProcessor, BatchConfig
+from backend.storage.repositories import init_connection
 from backend.core.similarity import SimilarityMode
 
 
@@ -47,7 +48,8 @@ async def discover_concepts(min_cluster_size, source_id, limit):
     
     # Connect to database
     pool = await asyncpg.create_pool(
-        dsn="postgresql://localhost/langviz"  # TODO: Config
+        dsn="postgresql://localhost/langviz",  # TODO: Config
+        init=init_connection
     )
     
     click.echo("Loading entries...")
@@ -121,7 +123,8 @@ async def batch_process(batch_size, workers, source_id, resume_from):
     pool = await asyncpg.create_pool(
         dsn="postgresql://localhost/langviz",
         min_size=workers,
-        max_size=workers * 2
+        max_size=workers * 2,
+        init=init_connection
     )
     
     # Configure processor
@@ -186,7 +189,10 @@ async def analyze_difference(concept, language_a, language_b):
     )
     
     # Connect to database
-    pool = await asyncpg.create_pool(dsn="postgresql://localhost/langviz")
+    pool = await asyncpg.create_pool(
+        dsn="postgresql://localhost/langviz",
+        init=init_connection
+    )
     
     # Load entries
     async with pool.acquire() as conn:
@@ -273,7 +279,10 @@ async def visualize(method, dimensions, output):
     visualizer = ConceptVisualizer(reducer=reducer)
     
     # Connect to database
-    pool = await asyncpg.create_pool(dsn="postgresql://localhost/langviz")
+    pool = await asyncpg.create_pool(
+        dsn="postgresql://localhost/langviz",
+        init=init_connection
+    )
     
     # Load concepts
     async with pool.acquire() as conn:
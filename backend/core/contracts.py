@@ -62,7 +62,9 @@ class ICognateDetector(Protocol):
 class ICleaner(Protocol):
     """Contract for data cleaning operations.
     
-    Cleaners are pure, composable transformation functions.
+    Cleaners are pure, composable transformation functions. They may
+    also define apply_arrow(arr, **params) to clean a whole pyarrow
+    array at once; Pipeline.batch_apply_arrow uses it when present.
     """
     
     @property
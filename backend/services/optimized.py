@@ -22,6 +22,7 @@ from backend.services.embedding import OptimizedEmbeddingService
 from backend.services.concepts import ConceptAligner
 from backend.services.phonetic import PhoneticService
 from backend.storage.cache import EmbeddingCache, ConceptCache
+from backend.storage.repositories import init_connection
 from backend.interop.r_client import RPhyloClient
 from backend.interop.perl_client import PerlParserClient
 from backend.observ import get_logger
@@ -61,7 +62,8 @@ class OptimizedServiceContainer:
             max_size=50,
             command_timeout=300,
             max_cached_statement_lifetime=3600,
-            max_inactive_connection_lifetime=300
+            max_inactive_connection_lifetime=300,
+            init=init_connection
         )
         
         # GPU-accelerated embeddings (auto-detect GPU)
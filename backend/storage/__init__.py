@@ -13,7 +13,7 @@ from .cleaners import (
     LanguageCodeCleaner,
     DuplicateDetector,
 )
-from .pipeline import Pipeline, PipelineFactory, compose
+from .pipeline import Pipeline, PipelineBuilder, PipelineFactory, compose
 from .loaders import LoaderFactory, CLDFLoader, SwadeshLoader, StarlingLoader
 from .ingest import IngestService
 from .validators import EntryValidator, ValidatorFactory
@@ -32,6 +32,7 @@ __all__ = [
     "DuplicateDetector",
     # Pipelines
     "Pipeline",
+    "PipelineBuilder",
     "PipelineFactory",
     "compose",
     # Loaders
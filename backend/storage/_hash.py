@@ -0,0 +1,50 @@
+"""Content checksums for raw entries.
+
+Hashes canonical (sorted-key) orjson bytes with BLAKE3 when available,
+falling back to SHA-256. Digests carry an algorithm prefix ("b3:" or
+"s256:") so hosts with and without blake3 never store the same payload
+under two unrelated checksums that look alike; see migration 004.
+"""
+
+import hashlib
+
+import orjson
+
+try:
+    import blake3
+    BLAKE3_AVAILABLE = True
+except ImportError:
+    BLAKE3_AVAILABLE = False
+
+# Pre-initialized SHA-256 state. Copying it skips the per-call OpenSSL
+# digest lookup that hashlib.sha256() does; OpenSSL still dispatches
+# to SHA-NI where the CPU has it.
+_sha256_copy = hashlib.sha256().copy
+
+
+def _checksum(data: dict) -> str:
+    """Checksum of a raw entry payload.
+
+    orjson returns bytes directly, so there is no intermediate str or
+    .encode() copy before hashing.
+    """
+    return _digest(orjson.dumps(data, option=orjson.OPT_SORT_KEYS))
+
+
+def _checksum_ordered(data: dict) -> str:
+    """Checksum of a payload whose keys were inserted in sorted order.
+
+    For loaders with a fixed schema, building the dict with its keys
+    already sorted yields the same bytes as _checksum() without paying
+    for a key sort on every row.
+    """
+    return _digest(orjson.dumps(data))
+
+
+def _digest(payload: bytes) -> str:
+    if BLAKE3_AVAILABLE:
+        return 'b3:' + blake3.blake3(payload).hexdigest()
+
+    h = _sha256_copy()
+    h.update(payload)
+    return 's256:' + h.hexdigest()
@@ -273,7 +273,7 @@ class BulkWriter:
                 FROM (
                     SELECT
                         unnest($1::text[]) AS id,
-                        unnest($2::vector(768)[]) AS embedding
+                        unnest($2::text[]) AS embedding
                 ) AS data
                 WHERE entries.id = data.id
                 """,
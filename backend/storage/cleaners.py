@@ -10,6 +10,20 @@ from typing import Optional
 from dataclasses import dataclass
 import panphon
 
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+# Characters str.isspace() accepts, as an RE2 class (RE2's \s is ASCII-only)
+_ARROW_WHITESPACE = (
+    r'[\t-\r\x1c-\x20\x85\xa0\x{1680}\x{2000}-\x{200a}'
+    r'\x{2028}\x{2029}\x{202f}\x{205f}\x{3000}]'
+)
+
 
 @dataclass(frozen=True)
 class IPACleaner:
@@ -84,6 +98,81 @@ class TextNormalizer:
         
         return result
     
+    def apply_arrow(
+        self,
+        arr,
+        lowercase: bool = True,
+        remove_punctuation: bool = False,
+        normalize_whitespace: bool = True,
+        unicode_form: str = "NFC",
+        **params
+    ):
+        """Vectorized clean() over a pyarrow string array.
+        
+        Same steps as clean(), run as Arrow compute kernels. Arrow's
+        utf8_lower maps one character at a time, unlike str.lower (final
+        sigma, dotted capital I), so when lowercasing only all-ASCII
+        values take the kernels and the rest go through clean(). Nulls
+        pass through.
+        """
+        options = dict(
+            lowercase=lowercase,
+            remove_punctuation=remove_punctuation,
+            normalize_whitespace=normalize_whitespace,
+            unicode_form=unicode_form,
+        )
+        result = self._apply_kernels(arr, **options)
+        
+        if not lowercase:
+            return result
+        
+        # all() skips nulls, so an all-null array counts as ASCII
+        is_ascii = pc.string_is_ascii(arr)
+        if pc.all(is_ascii).as_py() is not False:
+            return result
+        
+        fallback = pa.array(
+            [
+                None if value is None or ascii_ else self.clean(value, **options)
+                for value, ascii_ in zip(arr.to_pylist(), is_ascii.to_pylist())
+            ],
+            type=result.type
+        )
+        return pc.if_else(is_ascii, result, fallback)
+    
+    @staticmethod
+    def _apply_kernels(
+        arr,
+        lowercase: bool,
+        remove_punctuation: bool,
+        normalize_whitespace: bool,
+        unicode_form: str
+    ):
+        result = arr
+        
+        if unicode_form in ('NFC', 'NFD', 'NFKC', 'NFKD'):
+            result = pc.utf8_normalize(result, form=unicode_form)
+        
+        if lowercase:
+            result = pc.utf8_lower(result)
+        
+        if remove_punctuation:
+            result = pc.replace_substring_regex(
+                result,
+                pattern=r'[^\p{L}\p{N}_' + _ARROW_WHITESPACE[1:],
+                replacement=''
+            )
+        
+        # Collapsing first leaves only single spaces at the ends, so
+        # trimming afterwards matches strip-then-collapse
+        if normalize_whitespace:
+            result = pc.replace_substring_regex(
+                result, pattern=_ARROW_WHITESPACE + '+', replacement=' '
+            )
+            result = pc.utf8_trim(result, characters=' ')
+        
+        return result
+    
     def validate(self, text: str) -> bool:
         """Check if text is valid."""
         return bool(text and text.strip())
@@ -256,7 +256,7 @@ class IngestService:
                         CREATE TEMPORARY TABLE raw_entries_temp (
                             source_id VARCHAR(255),
                             raw_data JSONB,
-                            checksum VARCHAR(64),
+                            checksum VARCHAR(72),
                             file_path TEXT,
                             line_number INTEGER
                         ) ON COMMIT DROP
@@ -400,7 +400,7 @@ class IngestService:
                         
                         # Create entry
                         entry = Entry(
-                            id=f"{raw_data.get('source_id', 'unknown')}_{raw['checksum'][:16]}",
+                            id=f"{raw_data.get('source_id', 'unknown')}_{raw['checksum'][-16:]}",
                             headword=cleaned_data.get('headword', ''),
                             ipa=cleaned_data.get('ipa', ''),
                             language=cleaned_data.get('language', ''),
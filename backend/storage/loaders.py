@@ -4,42 +4,153 @@ Specialized loaders for CLDF, Swadesh lists, and other formats.
 """
 
 import csv
-import json
+import functools
 import hashlib
+import json
+import mmap
+import os
+import re
 from pathlib import Path
+from concurrent.futures import ThreadPoolExecutor
+from itertools import chain
 from typing import Iterator, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 from datetime import datetime
 
+import orjson
+
+from backend.storage._hash import _checksum, _checksum_ordered
+
 try:
-    import pycldf
-    PYCLDF_AVAILABLE = True
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
 except ImportError:
-    PYCLDF_AVAILABLE = False
+    PYARROW_AVAILABLE = False
 
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+try:
+    from datasketch import MinHash, MinHashLSH
+    DATASKETCH_AVAILABLE = True
+except ImportError:
+    DATASKETCH_AVAILABLE = False
 
-@dataclass
+
+# Read buffer for sequential scans (default 8 KiB means ~131k read()
+# syscalls per GB)
+_READ_BUFFER = 1 << 20
+
+
+def _advise_sequential(f) -> None:
+    """Hint the kernel to read ahead aggressively (no-op off Linux)."""
+    if hasattr(os, 'posix_fadvise'):
+        try:
+            os.posix_fadvise(f.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+        except OSError:
+            pass  # Pipes and FIFOs (ESPIPE); the hint is optional
+
+
+@dataclass(slots=True, frozen=True)
 class RawEntry:
-    """Minimally processed entry from source."""
+    """Minimally processed entry from source.
+    
+    Slotted: no per-instance __dict__, which adds up over millions of rows.
+    """
     source_id: str
     data: dict
     checksum: str
     file_path: Optional[str] = None
     line_number: Optional[int] = None
+    is_near_dup: bool = False
+
+
+# Fallback fingerprint covers this much of the canonical JSON
+_FINGERPRINT_PREFIX = 4096
+
+
+class DedupTracker:
+    """Collapse near-duplicate entries across loads onto one checksum.
+    
+    Entries whose (field, value) pairs have Jaccard >= threshold with an
+    earlier entry (MinHash-LSH via datasketch) take that entry's checksum
+    and are flagged is_near_dup, so ON CONFLICT (checksum) drops them at
+    insert. Without datasketch, entries match on a SHA-1 of the first
+    4 KiB of canonical JSON instead.
+    """
+    
+    def __init__(self, threshold: float = 0.85, num_perm: int = 64):
+        self._num_perm = num_perm
+        self._checksums: dict = {}
+        
+        if DATASKETCH_AVAILABLE:
+            self._lsh = MinHashLSH(threshold=threshold, num_perm=num_perm)
+        else:
+            self._lsh = None
+    
+    def mark(self, entry: RawEntry) -> RawEntry:
+        """Return entry, redirected to an earlier checksum if a near-dup."""
+        if self._lsh is None:
+            payload = orjson.dumps(entry.data, option=orjson.OPT_SORT_KEYS)
+            key = hashlib.sha1(payload[:_FINGERPRINT_PREFIX]).digest()
+            original = self._checksums.get(key)
+            if original is None:
+                self._checksums[key] = entry.checksum
+                return entry
+        else:
+            minhash = self._minhash(entry.data)
+            matches = self._lsh.query(minhash)
+            if not matches:
+                key = str(len(self._checksums))
+                self._lsh.insert(key, minhash)
+                self._checksums[key] = entry.checksum
+                return entry
+            original = self._checksums[matches[0]]
+        
+        return replace(entry, checksum=original, is_near_dup=True)
+    
+    def filter(self, entries: Iterator[RawEntry]) -> Iterator[RawEntry]:
+        """Mark every entry of a loader's stream."""
+        for entry in entries:
+            yield self.mark(entry)
+    
+    def _minhash(self, data: dict):
+        # One shingle per field: byte n-grams over short records make
+        # unrelated entries with the same keys look near-identical
+        mh = MinHash(num_perm=self._num_perm)
+        mh.update_batch([
+            orjson.dumps([key, value], option=orjson.OPT_SORT_KEYS)
+            for key, value in data.items()
+        ])
+        return mh
+
+
+@functools.cache
+def _pycldf():
+    """Import pycldf on first use (it pulls in a large dependency tree)."""
+    try:
+        import pycldf
+    except ImportError:
+        return None
+    return pycldf
 
 
 class CLDFLoader:
     """Load data from Cross-Linguistic Data Formats (CLDF)."""
     
     def __init__(self):
-        if not PYCLDF_AVAILABLE:
+        if _pycldf() is None:
             raise ImportError(
                 "pycldf not installed. Install with: pip install pycldf"
             )
     
     def load(self, dataset_path: str, source_id: str) -> Iterator[RawEntry]:
         """Load CLDF dataset and yield raw entries."""
-        dataset = pycldf.Dataset.from_metadata(
+        dataset = _pycldf().Dataset.from_metadata(
             Path(dataset_path) / "metadata.json"
         )
         
@@ -47,18 +158,16 @@ class CLDFLoader:
         if 'FormTable' in dataset:
             for idx, form in enumerate(dataset['FormTable']):
                 data = {
+                    'comment': form.get('Comment'),
+                    'concept': form.get('Parameter_ID'),
                     'headword': form.get('Form'),
                     'language': form.get('Language_ID'),
-                    'concept': form.get('Parameter_ID'),
                     'segments': form.get('Segments'),
                     'source': form.get('Source'),
-                    'comment': form.get('Comment'),
                 }
                 
-                # Compute checksum
-                checksum = hashlib.sha256(
-                    json.dumps(data, sort_keys=True).encode()
-                ).hexdigest()
+                # Keys are listed in sorted order (canonical form)
+                checksum = _checksum_ordered(data)
                 
                 yield RawEntry(
                     source_id=source_id,
@@ -72,16 +181,14 @@ class CLDFLoader:
         if 'CognateTable' in dataset:
             for idx, cognate in enumerate(dataset['CognateTable']):
                 data = {
-                    'type': 'cognate',
-                    'form_id': cognate.get('Form_ID'),
-                    'cognateset_id': cognate.get('Cognateset_ID'),
                     'alignment': cognate.get('Alignment'),
+                    'cognateset_id': cognate.get('Cognateset_ID'),
                     'doubt': cognate.get('Doubt'),
+                    'form_id': cognate.get('Form_ID'),
+                    'type': 'cognate',
                 }
                 
-                checksum = hashlib.sha256(
-                    json.dumps(data, sort_keys=True).encode()
-                ).hexdigest()
+                checksum = _checksum_ordered(data)
                 
                 yield RawEntry(
                     source_id=source_id,
@@ -93,39 +200,109 @@ class CLDFLoader:
 
 
 class SwadeshLoader:
-    """Load Swadesh comparative wordlists."""
+    """Load Swadesh comparative wordlists.
+    
+    Uses PyArrow's multithreaded CSV reader when available; falls back
+    to csv.DictReader otherwise.
+    """
     
     def load(self, csv_path: str, source_id: str) -> Iterator[RawEntry]:
         """Load Swadesh list from CSV."""
-        with open(csv_path, 'r', encoding='utf-8') as f:
+        if PYARROW_AVAILABLE:
+            rows = self._read_columnar(csv_path)
+        else:
+            rows = self._read_rows(csv_path)
+        
+        for line_num, concept, translations in rows:
+            for lang, word in translations:
+                if not word or word.strip() == '-':
+                    continue
+                
+                data = {
+                    'concept': concept,
+                    'headword': word.strip(),
+                    'language': lang,
+                    'source_type': 'swadesh',
+                }
+                
+                checksum = _checksum_ordered(data)
+                
+                yield RawEntry(
+                    source_id=source_id,
+                    data=data,
+                    checksum=checksum,
+                    file_path=csv_path,
+                    line_number=line_num
+                )
+    
+    def _read_columnar(self, csv_path: str) -> Iterator[tuple]:
+        """Parse whole sheet with Arrow, then walk it row-major.
+        
+        Arrow rejects ragged rows that DictReader pads, so those sheets
+        go through _read_rows instead, as do pipes (the header is read
+        separately, so the file has to be opened twice).
+        """
+        if not os.path.isfile(csv_path):
+            return self._read_rows(csv_path)
+        
+        with open(csv_path, 'r', encoding='utf-8', newline='') as f:
+            header = next(csv.reader(f), [])
+        
+        if not header:
+            return iter(())
+        
+        try:
+            # Keep every cell as text (no numeric/null inference)
+            table = pa_csv.read_csv(
+                csv_path,
+                convert_options=pa_csv.ConvertOptions(
+                    column_types={name: pa.string() for name in header},
+                    strings_can_be_null=False,
+                )
+            )
+        except pa.ArrowInvalid:
+            return self._read_rows(csv_path)
+        
+        return self._walk_table(table)
+    
+    @staticmethod
+    def _walk_table(table) -> Iterator[tuple]:
+        columns = table.to_pydict()
+        concepts = columns.pop('concept', [None] * table.num_rows)
+        languages = list(columns)
+        cells = list(zip(*columns.values())) if columns else [()] * table.num_rows
+        
+        for idx, (concept, row) in enumerate(zip(concepts, cells)):
+            yield idx + 2, concept, zip(languages, row)
+    
+    def _read_rows(self, csv_path: str) -> Iterator[tuple]:
+        """Row-at-a-time fallback via csv.DictReader."""
+        with open(csv_path, 'r', encoding='utf-8', buffering=_READ_BUFFER) as f:
+            _advise_sequential(f)
             reader = csv.DictReader(f)
             
             for line_num, row in enumerate(reader, start=2):
                 # Each row has concept and translations
                 concept = row.pop('concept', None)
-                
-                for lang, word in row.items():
-                    if not word or word.strip() == '-':
-                        continue
-                    
-                    data = {
-                        'headword': word.strip(),
-                        'language': lang,
-                        'concept': concept,
-                        'source_type': 'swadesh',
-                    }
-                    
-                    checksum = hashlib.sha256(
-                        json.dumps(data, sort_keys=True).encode()
-                    ).hexdigest()
-                    
-                    yield RawEntry(
-                        source_id=source_id,
-                        data=data,
-                        checksum=checksum,
-                        file_path=csv_path,
-                        line_number=line_num
-                    )
+                yield line_num, concept, row.items()
+
+
+# Starling/Toolbox field markers handled by the Python fallback
+_STARLING_FIELD = re.compile(rb'(?m)^[ \t]*\\(lx|ph|de|et|ps|lg) ([^\n]*)')
+_STARLING_FIELDS = {
+    b'de': 'definition',
+    b'et': 'etymology',
+    b'ps': 'pos_tag',
+    b'lg': 'language',
+}
+
+
+# Entries per background checksum task in StarlingLoader._load_via_grpc
+_CHECKSUM_CHUNK = 1024
+
+
+def _checksum_all(entries: list[dict]) -> list[str]:
+    return [_checksum(entry) for entry in entries]
 
 
 class StarlingLoader:
@@ -141,7 +318,6 @@ class StarlingLoader:
             use_grpc: If True, use Perl gRPC service. If False, fallback to Python.
         """
         self._use_grpc = use_grpc
-        self._grpc_client = None
     
     def load(self, file_path: str, source_id: str) -> Iterator[RawEntry]:
         """Load Starling format dictionary."""
@@ -156,7 +332,11 @@ class StarlingLoader:
         yield from self._load_python_fallback(file_path, source_id)
     
     def _load_via_grpc(self, file_path: str, source_id: str) -> Iterator[RawEntry]:
-        """Load via Perl service (Perl's superior regex via JSON-RPC)."""
+        """Load via Perl service (Perl's superior regex via JSON-RPC).
+        
+        A connection is opened per call and closed once the parse
+        returns, so a shared (cached) loader holds no connection state.
+        """
         from backend.interop.perl_client import PerlParserClient
         from backend.config import get_settings
         
@@ -168,12 +348,18 @@ class StarlingLoader:
         ) as client:
             # Call Perl parser via JSON-RPC
             entries = client.parse_starling_dictionary(file_path)
+        
+        chunks = [
+            entries[i:i + _CHECKSUM_CHUNK]
+            for i in range(0, len(entries), _CHECKSUM_CHUNK)
+        ]
+        
+        # Checksums are computed ahead in a worker thread so hashing
+        # overlaps with whatever the consumer does between yields
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            checksums = chain.from_iterable(executor.map(_checksum_all, chunks))
             
-            for idx, entry_data in enumerate(entries):
-                checksum = hashlib.sha256(
-                    json.dumps(entry_data, sort_keys=True).encode()
-                ).hexdigest()
-                
+            for idx, (entry_data, checksum) in enumerate(zip(entries, checksums)):
                 yield RawEntry(
                     source_id=source_id,
                     data=entry_data,
@@ -187,51 +373,61 @@ class StarlingLoader:
         file_path: str,
         source_id: str
     ) -> Iterator[RawEntry]:
-        """Fallback Python implementation (less powerful regex)."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            current_entry = {}
-            line_num = 0
-            entry_start = 0
+        """Fallback Python implementation (less powerful regex).
+        
+        Scans a memory map of the file with one compiled alternation
+        so field dispatch happens in the regex engine, not per line.
+        """
+        with open(file_path, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return
             
-            for line in f:
-                line_num += 1
-                line = line.strip()
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
                 
-                # Entry markers (basic patterns only)
-                if line.startswith('\\lx '):
-                    if current_entry:
-                        yield self._create_entry(
-                            source_id,
-                            current_entry,
-                            file_path,
-                            entry_start
-                        )
-                    current_entry = {'headword': line[4:]}
-                    entry_start = line_num
+                current_entry = {}
+                entry_start = 0
+                line_num = 1
+                scanned = 0
                 
-                elif line.startswith('\\ph '):
-                    current_entry['ipa'] = line[4:].strip('[]')
-                
-                elif line.startswith('\\de '):
-                    current_entry['definition'] = line[4:]
-                
-                elif line.startswith('\\et '):
-                    current_entry['etymology'] = line[4:]
-                
-                elif line.startswith('\\ps '):
-                    current_entry['pos_tag'] = line[4:]
+                for match in _STARLING_FIELD.finditer(mm):
+                    value = match.group(2).rstrip().decode('utf-8')
+                    if not value:
+                        continue
+                    
+                    marker = match.group(1)
+                    
+                    # Entry markers (basic patterns only)
+                    if marker == b'lx':
+                        if current_entry:
+                            yield self._create_entry(
+                                source_id,
+                                current_entry,
+                                file_path,
+                                entry_start
+                            )
+                        
+                        line_num += mm[scanned:match.start()].count(b'\n')
+                        scanned = match.start()
+                        
+                        current_entry = {'headword': value}
+                        entry_start = line_num
+                    
+                    elif marker == b'ph':
+                        current_entry['ipa'] = value.strip('[]')
+                    
+                    else:
+                        current_entry[_STARLING_FIELDS[marker]] = value
                 
-                elif line.startswith('\\lg '):
-                    current_entry['language'] = line[4:]
-            
-            # Yield last entry
-            if current_entry:
-                yield self._create_entry(
-                    source_id,
-                    current_entry,
-                    file_path,
-                    entry_start
-                )
+                # Yield last entry
+                if current_entry:
+                    yield self._create_entry(
+                        source_id,
+                        current_entry,
+                        file_path,
+                        entry_start
+                    )
     
     def _create_entry(
         self,
@@ -241,9 +437,7 @@ class StarlingLoader:
         line_number: int
     ) -> RawEntry:
         """Create RawEntry from parsed data."""
-        checksum = hashlib.sha256(
-            json.dumps(data, sort_keys=True).encode()
-        ).hexdigest()
+        checksum = _checksum(data)
         
         return RawEntry(
             source_id=source_id,
@@ -255,20 +449,25 @@ class StarlingLoader:
 
 
 class JSONLoader:
-    """Generic JSON dictionary loader."""
+    """Generic JSON dictionary loader.
+    
+    Streams entries with ijson when available so memory stays bounded
+    by the largest entry rather than the whole document.
+    """
     
     def load(self, file_path: str, source_id: str) -> Iterator[RawEntry]:
         """Load entries from JSON file."""
-        with open(file_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
-        # Support both list of entries and nested structures
-        entries = data if isinstance(data, list) else data.get('entries', [])
+        if IJSON_AVAILABLE:
+            entries = self._stream_entries(file_path)
+        else:
+            with open(file_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+            
+            # Support both list of entries and nested structures
+            entries = data if isinstance(data, list) else data.get('entries', [])
         
         for idx, entry in enumerate(entries):
-            checksum = hashlib.sha256(
-                json.dumps(entry, sort_keys=True).encode()
-            ).hexdigest()
+            checksum = _checksum(entry)
             
             yield RawEntry(
                 source_id=source_id,
@@ -277,6 +476,21 @@ class JSONLoader:
                 file_path=file_path,
                 line_number=idx
             )
+    
+    def _stream_entries(self, file_path: str) -> Iterator[dict]:
+        """Incrementally parse entries, detecting root shape from first byte."""
+        with open(file_path, 'rb', buffering=_READ_BUFFER) as f:
+            _advise_sequential(f)
+            head = f.read(64).lstrip(b'\xef\xbb\xbf \t\r\n')
+            f.seek(0)
+            
+            prefix = 'item' if head.startswith(b'[') else 'entries.item'
+            
+            # use_float keeps numbers as float (not Decimal) so checksums
+            # match the json.load path
+            yield from ijson.items(
+                f, prefix, use_float=True, buf_size=_READ_BUFFER
+            )
 
 
 class KaikkiLoader:
@@ -296,7 +510,8 @@ class KaikkiLoader:
         """
         import json
         
-        with open(file_path, 'r', encoding='utf-8') as f:
+        with open(file_path, 'r', encoding='utf-8', buffering=_READ_BUFFER) as f:
+            _advise_sequential(f)
             for line_num, line in enumerate(f, start=1):
                 if not line.strip():
                     continue
@@ -320,11 +535,11 @@ class KaikkiLoader:
                     
                     # Build data dict
                     data = {
-                        'headword': entry.get('word', ''),
-                        'language': entry.get('lang_code', entry.get('lang', '')),
-                        'ipa': ipa,
                         'definition': ' | '.join(definitions) if definitions else '',
                         'etymology': entry.get('etymology_text', ''),
+                        'headword': entry.get('word', ''),
+                        'ipa': ipa,
+                        'language': entry.get('lang_code', entry.get('lang', '')),
                         'pos_tag': entry.get('pos', ''),
                         'source_type': 'wiktionary',
                     }
@@ -333,9 +548,7 @@ class KaikkiLoader:
                     if not data['headword'] or not data['language']:
                         continue
                     
-                    checksum = hashlib.sha256(
-                        json.dumps(data, sort_keys=True).encode()
-                    ).hexdigest()
+                    checksum = _checksum_ordered(data)
                     
                     yield RawEntry(
                         source_id=source_id,
@@ -392,19 +605,17 @@ class PerseusXMLLoader:
                 language = 'grc' if 'greek' in source_id.lower() else 'la'
                 
                 data = {
-                    'headword': headword,
-                    'language': language,
                     'definition': ' | '.join(definitions),
                     'etymology': etymology,
+                    'headword': headword,
+                    'language': language,
                     'source_type': 'perseus',
                 }
                 
                 if not headword:
                     continue
                 
-                checksum = hashlib.sha256(
-                    json.dumps(data, sort_keys=True).encode()
-                ).hexdigest()
+                checksum = _checksum_ordered(data)
                 
                 yield RawEntry(
                     source_id=source_id,
@@ -418,25 +629,49 @@ class PerseusXMLLoader:
             raise ValueError(f"Failed to parse XML file {file_path}: {e}")
 
 
+_LOADERS = {
+    'cldf': CLDFLoader,
+    'swadesh': SwadeshLoader,
+    'csv': SwadeshLoader,  # Alias
+    'starling': StarlingLoader,
+    'json': JSONLoader,
+    'jsonl': KaikkiLoader,
+    'xml': PerseusXMLLoader,
+}
+
+
 class LoaderFactory:
     """Factory for selecting appropriate loader."""
     
     @staticmethod
-    def get_loader(format: str):
-        """Get loader for specified format."""
-        loaders = {
-            'cldf': CLDFLoader,
-            'swadesh': SwadeshLoader,
-            'csv': SwadeshLoader,  # Alias
-            'starling': StarlingLoader,
-            'json': JSONLoader,
-            'jsonl': KaikkiLoader,
-            'xml': PerseusXMLLoader,
-        }
+    def get_loader(format: str, dedup: Optional[DedupTracker] = None):
+        """Get loader for specified format.
         
-        loader_cls = loaders.get(format.lower())
-        if not loader_cls:
-            raise ValueError(f"Unknown format: {format}")
+        Loaders are stateless, so one instance per format is shared. With
+        a DedupTracker, the loader's entries are passed through it.
+        """
+        loader = _cached_loader(format.lower())
+        if dedup is None:
+            return loader
         
-        return loader_cls()
+        return _DedupLoader(loader, dedup)
+
 
+@functools.lru_cache(maxsize=16)
+def _cached_loader(format: str):
+    """Instantiate (once) the loader registered for a lowercased format."""
+    loader_cls = _LOADERS.get(format)
+    if not loader_cls:
+        raise ValueError(f"Unknown format: {format}")
+    
+    return loader_cls()
+
+
+@dataclass(frozen=True)
+class _DedupLoader:
+    """Loader wrapper that runs entries through a shared DedupTracker."""
+    loader: object
+    dedup: DedupTracker
+    
+    def load(self, path: str, source_id: str) -> Iterator[RawEntry]:
+        return self.dedup.filter(self.loader.load(path, source_id))
@@ -20,7 +20,7 @@ CREATE TABLE IF NOT EXISTS raw_entries (
     id SERIAL PRIMARY KEY,
     source_id VARCHAR(100) NOT NULL REFERENCES data_sources(id),
     raw_data JSONB NOT NULL,
-    checksum VARCHAR(64) NOT NULL UNIQUE,  -- SHA-256 of raw_data
+    checksum VARCHAR(64) NOT NULL UNIQUE,  -- SHA-256 of raw_data (prefixed digest since 004)
     ingested_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
     file_path TEXT,
     line_number INTEGER
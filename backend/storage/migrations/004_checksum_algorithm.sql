@@ -0,0 +1,12 @@
+-- Migration: Algorithm-prefixed raw entry checksums
+-- Checksums are now 'b3:<blake3 hex>' or 's256:<sha256 hex>' over
+-- orjson canonical bytes, replacing bare SHA-256 over
+-- json.dumps(sort_keys=True). This is a one-time break: existing rows
+-- keep their old checksums, so re-ingesting a source loaded before this
+-- migration inserts its entries again instead of hitting ON CONFLICT.
+-- Clear and reload affected sources (or run a fresh ingest) afterwards.
+
+ALTER TABLE raw_entries ALTER COLUMN checksum TYPE VARCHAR(72);
+
+COMMENT ON COLUMN raw_entries.checksum IS
+    'Algorithm-prefixed digest of raw_data: b3:<blake3> or s256:<sha256>';
@@ -3,15 +3,29 @@
 Functional composition of cleaners with automatic provenance tracking.
 """
 
+import os
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import cached_property, partial
 from typing import TypeVar, Callable, Optional
 from dataclasses import dataclass, field
 from datetime import datetime
 from backend.core.contracts import ICleaner
 from backend.storage.provenance import TransformStep
 
+try:
+    import pyarrow as pa
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 
 T = TypeVar('T')
 
+# sys._is_gil_enabled() exists on 3.13+; older interpreters always have a GIL
+_GIL_ENABLED = getattr(sys, '_is_gil_enabled', lambda: True)
+
 
 @dataclass
 class Pipeline:
@@ -49,60 +63,182 @@ class Pipeline:
         Returns (cleaned_value, provenance_steps).
         """
         result = value
-        steps = [] if track_provenance else None
+        
+        if not track_provenance:
+            for cleaner in self.cleaners:
+                result = cleaner.clean(result, **params)
+                self._check(cleaner, result)
+            
+            return result, None
+        
+        steps = []
+        
+        # Wall-clock stamp sampled once; per-step durations use the
+        # monotonic counter (datetime deltas are slower and .microseconds
+        # wraps past one second)
+        executed_at = datetime.utcnow()
         
         for cleaner in self.cleaners:
-            start = datetime.utcnow()
+            start_ns = time.perf_counter_ns()
             
             # Apply transformation
             result = cleaner.clean(result, **params)
             
-            # Track provenance
-            if track_provenance:
-                duration = (datetime.utcnow() - start).microseconds // 1000
-                step = TransformStep(
-                    id=f"{cleaner.name}_{start.timestamp()}",
-                    name=cleaner.name,
-                    version=cleaner.version,
-                    parameters=params,
-                    executed_at=start,
-                    duration_ms=duration
-                )
-                steps.append(step)
+            duration = (time.perf_counter_ns() - start_ns) // 1_000_000
             
-            # Validate if strict mode
-            if self.strict and not cleaner.validate(result):
-                raise ValueError(
-                    f"Validation failed after {cleaner.name}: {result}"
-                )
+            # Fields are built here from trusted values, so skip
+            # pydantic validation
+            steps.append(TransformStep.model_construct(
+                id=f"{cleaner.name}_{start_ns}",
+                name=cleaner.name,
+                version=cleaner.version,
+                parameters=params,
+                executed_at=executed_at,
+                duration_ms=duration
+            ))
+            
+            self._check(cleaner, result)
         
         return result, steps
     
+    def _check(self, cleaner: ICleaner, result: object) -> None:
+        """Validate cleaner output if strict mode."""
+        if self.strict and not cleaner.validate(result):
+            raise ValueError(
+                f"Validation failed after {cleaner.name}: {result}"
+            )
+    
     def batch_apply(
         self,
         values: list[T],
+        workers: int = 1,
+        chunksize: int = 256,
         **params
     ) -> list[tuple[T, Optional[list[TransformStep]]]]:
-        """Apply pipeline to multiple values."""
-        return [self.apply(v, **params) for v in values]
+        """Apply pipeline to multiple values.
+        
+        Cleaners are pure, so values can be split into chunks and cleaned
+        in parallel. workers=1 runs inline; workers=None uses every core.
+        Results are returned in input order.
+        """
+        if workers is None:
+            workers = os.cpu_count() or 1
+        
+        if workers <= 1 or len(values) <= chunksize:
+            return [self.apply(v, **params) for v in values]
+        
+        chunks = [
+            values[i:i + chunksize]
+            for i in range(0, len(values), chunksize)
+        ]
+        
+        if _GIL_ENABLED():
+            # The pipeline is pickled once per worker process rather than
+            # once per chunk; only the chunks are sent with each task
+            executor = ProcessPoolExecutor(
+                max_workers=workers,
+                initializer=_init_worker,
+                initargs=(self, params)
+            )
+            apply_chunk = _apply_chunk
+        else:
+            # Free-threaded builds run threads truly in parallel and
+            # share the pipeline without pickling anything
+            executor = ThreadPoolExecutor(max_workers=workers)
+            apply_chunk = partial(_clean_chunk, self, params)
+        
+        with executor:
+            results = executor.map(apply_chunk, chunks)
+            return [item for chunk in results for item in chunk]
+    
+    def batch_apply_arrow(self, values: 'pa.Array', **params) -> 'pa.Array':
+        """Apply pipeline column-wise to a pyarrow array.
+        
+        Cleaners with an apply_arrow() method run as vectorized kernels;
+        the rest are applied per element. Provenance is not tracked and
+        results are not validated (use validate_all for that).
+        """
+        result = values
+        
+        for cleaner in self.cleaners:
+            apply_arrow = getattr(cleaner, 'apply_arrow', None)
+            if apply_arrow is not None:
+                result = apply_arrow(result, **params)
+                continue
+            
+            result = pa.array([
+                None if value is None else cleaner.clean(value, **params)
+                for value in result.to_pylist()
+            ])
+        
+        return result
     
     def validate_all(self, values: list[T]) -> list[tuple[int, str]]:
         """Validate all values, returning list of (index, error) pairs."""
         errors = []
+        steps = [self._try_step(c) for c in self.cleaners]
         
+        # Validation failures come back as values rather than raised
+        # ValueErrors; only errors raised by clean() itself are caught
         for idx, value in enumerate(values):
+            result, error = value, None
             try:
-                self.apply(value, track_provenance=False)
+                for step in steps:
+                    result, error = step(result)
+                    if error is not None:
+                        break
             except ValueError as e:
-                errors.append((idx, str(e)))
+                error = str(e)
+            
+            if error is not None:
+                errors.append((idx, error))
         
         return errors
     
-    @property
+    def _try_step(
+        self,
+        cleaner: ICleaner
+    ) -> Callable[[T], tuple[Optional[T], Optional[str]]]:
+        """Resolve the non-raising clean call for one cleaner."""
+        if not self.strict:
+            return lambda value: (cleaner.clean(value), None)
+        
+        return partial(_try_clean, cleaner)
+    
+    @cached_property
     def signature(self) -> str:
-        """Unique signature for this pipeline configuration."""
+        """Unique signature for this pipeline configuration (interned)."""
         parts = [f"{c.name}:{c.version}" for c in self.cleaners]
-        return "_".join(parts)
+        return sys.intern("_".join(parts))
+
+
+class PipelineBuilder:
+    """Mutable accumulator for building a Pipeline one cleaner at a time.
+    
+    Pipeline.add copies the cleaner list on every call; the builder
+    appends in place and hands its list to a single Pipeline on freeze().
+    """
+    
+    def __init__(self, strict: bool = True):
+        self._cleaners: Optional[list[ICleaner]] = []
+        self._strict = strict
+    
+    def add(self, cleaner: ICleaner) -> 'PipelineBuilder':
+        """Append cleaner (returns self for chaining)."""
+        if self._cleaners is None:
+            raise RuntimeError("PipelineBuilder already frozen")
+        
+        self._cleaners.append(cleaner)
+        return self
+    
+    def freeze(self) -> Pipeline:
+        """Build the pipeline, transferring ownership of the cleaner list."""
+        if self._cleaners is None:
+            raise RuntimeError("PipelineBuilder already frozen")
+        
+        pipeline = Pipeline(cleaners=self._cleaners, strict=self._strict)
+        self._cleaners = None
+        return pipeline
 
 
 @dataclass
@@ -160,6 +296,45 @@ class PipelineFactory:
         }
 
 
+def _try_clean(
+    cleaner: ICleaner,
+    value: T,
+    **params
+) -> tuple[Optional[T], Optional[str]]:
+    """Clean and validate without raising.
+    
+    Returns (cleaned, None), or (None, message) if the cleaned value
+    fails validation.
+    """
+    result = cleaner.clean(value, **params)
+    if cleaner.validate(result):
+        return result, None
+    return None, f"Validation failed after {cleaner.name}: {result}"
+
+
+# (pipeline, params) for this worker process, set by _init_worker
+_worker_state: tuple = ()
+
+
+def _init_worker(pipeline: Pipeline, params: dict) -> None:
+    """Process pool initializer for Pipeline.batch_apply."""
+    global _worker_state
+    _worker_state = (pipeline, params)
+
+
+def _clean_chunk(
+    pipeline: Pipeline,
+    params: dict,
+    values: list[T]
+) -> list[tuple[T, Optional[list[TransformStep]]]]:
+    return [pipeline.apply(v, **params) for v in values]
+
+
+def _apply_chunk(values: list[T]) -> list[tuple[T, Optional[list[TransformStep]]]]:
+    """Worker entry point for Pipeline.batch_apply (must be top-level)."""
+    return _clean_chunk(*_worker_state, values)
+
+
 def compose(*cleaners: ICleaner, strict: bool = True) -> Pipeline:
     """Convenience function to compose cleaners into pipeline."""
     return Pipeline(list(cleaners), strict=strict)
@@ -3,10 +3,11 @@
 Immutable record of data transformations and source attribution.
 """
 
+import sys
 from datetime import datetime
 from enum import Enum
 from typing import Optional
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
 
 
 class SourceType(str, Enum):
@@ -61,12 +62,33 @@ class Provenance(BaseModel):
     record_id: str
     source: Source
     transforms: list[TransformStep]
-    checksum: str  # SHA-256 of raw data
+    checksum: str  # 'b3:' BLAKE3 or 's256:' SHA-256 of raw data
     created_at: datetime = Field(default_factory=datetime.utcnow)
     
+    _pipeline_version: str = PrivateAttr()
+    
+    @model_validator(mode='after')
+    def _build_pipeline_version(self) -> 'Provenance':
+        steps = "_".join(f"{t.name}:{t.version}" for t in self.transforms)
+        self._pipeline_version = sys.intern(f"{self.source.id}_{steps}")
+        return self
+    
+    def model_copy(self, *, update=None, deep: bool = False) -> 'Provenance':
+        """Copy the record, rebuilding pipeline_version for updated fields.
+        
+        model_copy skips validation and copies private attributes as-is.
+        """
+        copy = super().model_copy(update=update, deep=deep)
+        if update:
+            copy._build_pipeline_version()
+        return copy
+    
     @property
     def pipeline_version(self) -> str:
-        """Version identifier for entire pipeline."""
-        steps = "_".join(f"{t.name}:{t.version}" for t in self.transforms)
-        return f"{self.source.id}_{steps}"
+        """Version identifier for entire pipeline.
+        
+        Built once per (frozen) record and interned, since it is used as a
+        lookup key downstream.
+        """
+        return self._pipeline_version
 
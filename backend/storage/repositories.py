@@ -3,14 +3,62 @@
 Uses PostgreSQL with pgvector for embeddings and full-text search.
 """
 
-from typing import Optional
+from typing import AsyncIterator, Optional, Sequence
 import asyncpg
+import numpy as np
+import orjson
 from backend.core import Entry, SimilarityScore, CognateSet
 from backend.core.contracts import IRepository
+from backend.storage.bulk import _format_array
+
+try:
+    from pgvector.asyncpg import register_vector
+    PGVECTOR_AVAILABLE = True
+except ImportError:
+    PGVECTOR_AVAILABLE = False
+
+
+async def init_connection(conn: asyncpg.Connection) -> None:
+    """Per-connection setup; pass as asyncpg.create_pool(init=...).
+    
+    Registers the pgvector codec so embeddings are marshaled in binary
+    by the driver instead of parsed from text by Postgres.
+    """
+    if PGVECTOR_AVAILABLE:
+        await register_vector(conn)
+
+
+def _to_vector(embedding: Optional[Sequence[float]]):
+    """Pack embedding for a vector parameter.
+    
+    With the pgvector codec (see init_connection) this is a float32
+    array: the codec copies a contiguous buffer in one block rather than
+    converting each Python float, and FP32 halves bytes on the wire.
+    Without it, asyncpg only sends vector parameters as text, so the
+    pgvector literal is passed instead.
+    """
+    if embedding is None:
+        return None
+    if not PGVECTOR_AVAILABLE:
+        return _format_array(embedding)
+    return np.asarray(embedding, dtype=np.float32)
+
+
+def _from_vector(value) -> Optional[list[float]]:
+    """Unpack a vector column (decoded array or text literal) into a list."""
+    if value is None or isinstance(value, list):
+        return value
+    if isinstance(value, str):
+        # pgvector's text form '[1,2,3]' is a JSON array
+        return orjson.loads(value)
+    return value.tolist()
 
 
 class EntryRepository(IRepository):
-    """Repository for lexical entries with vector search."""
+    """Repository for lexical entries with vector search.
+    
+    The pool should be created with init=init_connection.
+    """
     
     def __init__(self, pool: asyncpg.Pool):
         self._pool = pool
@@ -53,13 +101,100 @@ class EntryRepository(IRepository):
                 entry.definition,
                 entry.etymology,
                 entry.pos_tag,
-                entry.embedding,
+                _to_vector(entry.embedding),
                 entry.created_at
             )
             return entry.id
     
+    async def save_many(self, entries: Sequence[Entry]) -> list[str]:
+        """Persist entries in bulk (upsert semantics of save).
+        
+        Rows are streamed into a temporary staging table with binary
+        COPY, then merged with one INSERT ... ON CONFLICT. Embeddings are
+        staged as pgvector text literals and cast on merge.
+        """
+        # Last occurrence wins, as with repeated save() calls
+        unique = list({entry.id: entry for entry in entries}.values())
+        if not unique:
+            return []
+        
+        records = [
+            (
+                entry.id,
+                entry.headword,
+                entry.ipa,
+                entry.language,
+                entry.definition,
+                entry.etymology,
+                entry.pos_tag,
+                _format_array(entry.embedding) if entry.embedding else None,
+                entry.created_at
+            )
+            for entry in unique
+        ]
+        
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    CREATE TEMPORARY TABLE entries_stage (
+                        id VARCHAR(255),
+                        headword VARCHAR(255),
+                        ipa VARCHAR(255),
+                        language VARCHAR(3),
+                        definition TEXT,
+                        etymology TEXT,
+                        pos_tag VARCHAR(50),
+                        embedding TEXT,
+                        created_at TIMESTAMP
+                    ) ON COMMIT DROP
+                    """
+                )
+                
+                await conn.copy_records_to_table(
+                    'entries_stage',
+                    records=records,
+                    columns=[
+                        'id', 'headword', 'ipa', 'language', 'definition',
+                        'etymology', 'pos_tag', 'embedding', 'created_at'
+                    ]
+                )
+                
+                await conn.execute(
+                    """
+                    INSERT INTO entries (
+                        id, headword, ipa, language, definition,
+                        etymology, pos_tag, embedding, created_at
+                    )
+                    SELECT id, headword, ipa, language, definition,
+                           etymology, pos_tag, embedding::vector, created_at
+                    FROM entries_stage
+                    ON CONFLICT (id) DO UPDATE SET
+                        headword = EXCLUDED.headword,
+                        ipa = EXCLUDED.ipa,
+                        definition = EXCLUDED.definition,
+                        etymology = EXCLUDED.etymology,
+                        pos_tag = EXCLUDED.pos_tag,
+                        embedding = EXCLUDED.embedding
+                    """
+                )
+        
+        return [entry.id for entry in unique]
+    
     async def query(self, **filters) -> list[Entry]:
         """Query entries with filters."""
+        return [entry async for entry in self.iter_query(**filters)]
+    
+    async def iter_query(
+        self,
+        prefetch: int = 1000,
+        **filters
+    ) -> AsyncIterator[Entry]:
+        """Stream entries matching filters through a server-side cursor.
+        
+        At most `prefetch` rows are buffered client-side, so memory stays
+        flat regardless of result size.
+        """
         conditions = []
         params = []
         
@@ -74,16 +209,19 @@ class EntryRepository(IRepository):
         where_clause = f"WHERE {' AND '.join(conditions)}" if conditions else ""
         
         async with self._pool.acquire() as conn:
-            rows = await conn.fetch(
-                f"""
-                SELECT id, headword, ipa, language, definition,
-                       etymology, pos_tag, embedding, created_at
-                FROM entries
-                {where_clause}
-                """,
-                *params
-            )
-            return [self._row_to_entry(row) for row in rows]
+            # Cursors only live inside a transaction
+            async with conn.transaction():
+                async for row in conn.cursor(
+                    f"""
+                    SELECT id, headword, ipa, language, definition,
+                           etymology, pos_tag, embedding, created_at
+                    FROM entries
+                    {where_clause}
+                    """,
+                    *params,
+                    prefetch=prefetch
+                ):
+                    yield self._row_to_entry(row)
     
     async def similarity_search(
         self,
@@ -91,30 +229,45 @@ class EntryRepository(IRepository):
         limit: int = 10,
         threshold: float = 0.7
     ) -> list[tuple[Entry, float]]:
-        """Vector similarity search using pgvector."""
+        """Vector similarity search using pgvector.
+        
+        Filters and orders on raw cosine distance so the HNSW index can
+        return rows already in order; similarity is 1 - distance.
+        """
         async with self._pool.acquire() as conn:
-            rows = await conn.fetch(
-                """
-                SELECT id, headword, ipa, language, definition,
-                       etymology, pos_tag, embedding, created_at,
-                       1 - (embedding <=> $1::vector) as similarity
-                FROM entries
-                WHERE 1 - (embedding <=> $1::vector) >= $2
-                ORDER BY similarity DESC
-                LIMIT $3
-                """,
-                embedding,
-                threshold,
-                limit
-            )
+            async with conn.transaction():
+                # Candidate list must cover LIMIT or HNSW under-returns
+                await conn.execute(
+                    "SELECT set_config('hnsw.ef_search', $1, true)",
+                    str(max(limit * 2, 40))
+                )
+                
+                rows = await conn.fetch(
+                    """
+                    SELECT id, headword, ipa, language, definition,
+                           etymology, pos_tag, embedding, created_at,
+                           embedding <=> $1::vector AS distance
+                    FROM entries
+                    WHERE embedding <=> $1::vector <= $2
+                    ORDER BY embedding <=> $1::vector
+                    LIMIT $3
+                    """,
+                    _to_vector(embedding),
+                    1 - threshold,
+                    limit
+                )
+            
             return [
-                (self._row_to_entry(row), row["similarity"])
+                (self._row_to_entry(row), 1 - row["distance"])
                 for row in rows
             ]
     
     def _row_to_entry(self, row) -> Entry:
-        """Convert database row to Entry model."""
-        return Entry(
+        """Convert database row to Entry model.
+        
+        Rows come from typed columns, so pydantic validation is skipped.
+        """
+        return Entry.model_construct(
             id=row["id"],
             headword=row["headword"],
             ipa=row["ipa"],
@@ -122,7 +275,7 @@ class EntryRepository(IRepository):
             definition=row["definition"],
             etymology=row["etymology"],
             pos_tag=row["pos_tag"],
-            embedding=row["embedding"],
+            embedding=_from_vector(row["embedding"]),
             created_at=row["created_at"]
         )
 
@@ -168,6 +321,63 @@ class CognateRepository(IRepository):
             )
             return cognate_set.id
     
+    async def save_many(self, cognate_sets: Sequence[CognateSet]) -> list[str]:
+        """Persist cognate sets in bulk via COPY into a staging table."""
+        # Last occurrence wins, as with repeated save() calls
+        unique = list({cs.id: cs for cs in cognate_sets}.values())
+        if not unique:
+            return []
+        
+        records = [
+            (
+                cs.id,
+                cs.entries,
+                cs.confidence,
+                cs.proto_form,
+                cs.semantic_core
+            )
+            for cs in unique
+        ]
+        
+        async with self._pool.acquire() as conn:
+            async with conn.transaction():
+                await conn.execute(
+                    """
+                    CREATE TEMPORARY TABLE cognate_sets_stage (
+                        id VARCHAR(255),
+                        entries TEXT[],
+                        confidence FLOAT,
+                        proto_form VARCHAR(255),
+                        semantic_core TEXT
+                    ) ON COMMIT DROP
+                    """
+                )
+                
+                await conn.copy_records_to_table(
+                    'cognate_sets_stage',
+                    records=records,
+                    columns=[
+                        'id', 'entries', 'confidence', 'proto_form', 'semantic_core'
+                    ]
+                )
+                
+                await conn.execute(
+                    """
+                    INSERT INTO cognate_sets (
+                        id, entries, confidence, proto_form, semantic_core
+                    )
+                    SELECT id, entries, confidence, proto_form, semantic_core
+                    FROM cognate_sets_stage
+                    ON CONFLICT (id) DO UPDATE SET
+                        entries = EXCLUDED.entries,
+                        confidence = EXCLUDED.confidence,
+                        proto_form = EXCLUDED.proto_form,
+                        semantic_core = EXCLUDED.semantic_core
+                    """
+                )
+        
+        return [cs.id for cs in unique]
+    
     async def query(self, **filters) -> list[CognateSet]:
         """Query cognate sets."""
         async with self._pool.acquire() as conn:
@@ -177,8 +387,8 @@ class CognateRepository(IRepository):
             return [self._row_to_cognate_set(row) for row in rows]
     
     def _row_to_cognate_set(self, row) -> CognateSet:
-        """Convert database row to CognateSet model."""
-        return CognateSet(
+        """Convert database row to CognateSet model (no re-validation)."""
+        return CognateSet.model_construct(
             id=row["id"],
             entries=row["entries"],
             confidence=row["confidence"],
@@ -6,13 +6,44 @@ and progress tracking.
 """
 
 import asyncio
+import functools
 import gzip
+import hashlib
+import io
+import mmap
+import os
+import re
+import stat
+from array import array
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from dataclasses import dataclass
+from itertools import islice
 from pathlib import Path
 from typing import AsyncIterator, Iterator, TypeVar, Callable, Optional
 from collections import deque
 
+import numpy as np
 import orjson  # Faster than stdlib json
 
+try:
+    import rapidgzip  # Parallel gzip decompression
+    RAPIDGZIP_AVAILABLE = True
+except ImportError:
+    RAPIDGZIP_AVAILABLE = False
+
+try:
+    import xxhash
+    XXHASH_AVAILABLE = True
+except ImportError:
+    XXHASH_AVAILABLE = False
+
+try:
+    from pyroaring import BitMap64
+    PYROARING_AVAILABLE = True
+except ImportError:
+    PYROARING_AVAILABLE = False
+
 
 T = TypeVar('T')
 
@@ -21,98 +52,354 @@ T = TypeVar('T')
 # JSONL STREAMING (Memory-Efficient Line-by-Line)
 # ═══════════════════════════════════════════════════════════════════════
 
+# Bulk read size; one read() per 128 KiB instead of one per line
+READ_BUFFER_SIZE = 128 << 10
+
+
+def _iter_lines(f, buf_size: int = READ_BUFFER_SIZE) -> Iterator[bytes]:
+    """Split a binary file into lines (newline stripped) using bulk reads."""
+    carry = b''
+    
+    while block := f.read(buf_size):
+        lines = (carry + block).split(b'\n')
+        carry = lines.pop()
+        yield from lines
+    
+    if carry:
+        yield carry
+
+
+def _iter_mmap_lines(mm: mmap.mmap) -> Iterator[bytes]:
+    """Split a memory-mapped file into lines (newline stripped).
+    
+    Lines are sliced straight out of the page cache; there is no
+    intermediate read buffer to copy through.
+    """
+    find = mm.find
+    start = 0
+    end = find(b'\n')
+    
+    while end != -1:
+        yield mm[start:end]
+        start = end + 1
+        end = find(b'\n', start)
+    
+    if start < len(mm):
+        yield mm[start:]
+
+
+@dataclass(slots=True, frozen=True)
+class JsonlSource:
+    """A JSONL input, resolved once (one stat, no Path objects).
+    
+    size is None for anything that isn't a regular file (pipes, devices).
+    """
+    path: str
+    is_gz: bool
+    size: Optional[int]
+    
+    @classmethod
+    def from_path(cls, path: 'os.PathLike | str') -> 'JsonlSource':
+        path = os.fspath(path)
+        st = os.stat(path)
+        size = st.st_size if stat.S_ISREG(st.st_mode) else None
+        return cls(path=path, is_gz=path.endswith('.gz'), size=size)
+
+
+def _as_source(filepath: 'JsonlSource | os.PathLike | str') -> JsonlSource:
+    if isinstance(filepath, JsonlSource):
+        return filepath
+    return JsonlSource.from_path(filepath)
+
+
+@contextmanager
+def _open_lines(source: JsonlSource, compressed: bool):
+    """Open a JSONL file and yield an iterator over its raw lines.
+    
+    Regular uncompressed files are memory-mapped. Gzip files are decoded
+    with rapidgzip across all cores when it is installed. Its seek-point
+    index is saved next to the file as <name>.gzindex and reused while
+    the file's size and mtime match those recorded with it.
+    """
+    filepath = source.path
+    
+    if not compressed:
+        with open(filepath, 'rb') as f:
+            # Pipes and other special files can't be mapped; empty files
+            # can't either
+            if not source.size:
+                yield _iter_lines(f)
+                return
+            
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                if hasattr(mm, 'madvise'):
+                    mm.madvise(mmap.MADV_SEQUENTIAL)
+                
+                yield _iter_mmap_lines(mm)
+        return
+    
+    if not RAPIDGZIP_AVAILABLE:
+        with gzip.open(filepath, 'rb') as f:
+            yield _iter_lines(f)
+        return
+    
+    index = filepath + '.gzindex'
+    st = os.stat(filepath)
+    saved = _read_gzindex(index, st)
+    
+    with rapidgzip.open(filepath, parallelization=os.cpu_count() or 1) as f:
+        if saved is not None:
+            try:
+                f.import_index(io.BytesIO(saved))
+            except ValueError:
+                saved = None  # Doesn't fit this file; read unindexed
+        
+        yield _iter_lines(f)
+        
+        if saved is None and f.block_offsets_complete():
+            _write_gzindex(f, index, st)
+
+
+# First line of a .gzindex: the .gz file's size and mtime (ns) when the
+# index was exported. cp -p, rsync -a and tar keep old mtimes, so a
+# newer-than check alone could pair an index with a replaced file.
+_GZINDEX_HEADER = b'gzindex %d %d\n'
+
+
+def _read_gzindex(index: str, st: os.stat_result) -> Optional[bytes]:
+    """Saved rapidgzip index for a file with this stat, or None."""
+    try:
+        with open(index, 'rb') as f:
+            if f.readline() != _GZINDEX_HEADER % (st.st_size, st.st_mtime_ns):
+                return None
+            return f.read()
+    except OSError:
+        return None
+
+
+def _write_gzindex(f, index: str, st: os.stat_result) -> None:
+    """Save f's seek-point index, unless it outgrows the file itself."""
+    buf = io.BytesIO()
+    f.export_index(buf)
+    
+    # Small files yield indexes larger than the input; reading those
+    # back would cost more than it saves
+    if len(buf.getbuffer()) > st.st_size:
+        return
+    
+    tmp = f'{index}.{os.getpid()}.tmp'
+    try:
+        with open(tmp, 'wb') as out:
+            out.write(_GZINDEX_HEADER % (st.st_size, st.st_mtime_ns))
+            out.write(buf.getbuffer())
+        os.replace(tmp, index)
+    except OSError:
+        pass  # Read-only location; index is only a speedup
+
+
+def _parse_batch(batch: list[bytes], skip_errors: bool) -> list:
+    """Parse a batch of raw JSONL lines, skipping blank ones.
+    
+    Self-contained and module-level so it can run in any worker; the
+    whole batch normally costs a single orjson call.
+    """
+    # isspace() checks the same ASCII whitespace strip() removes, in C
+    # and without allocating a stripped copy; it is False for b''
+    lines = [line for line in batch if line and not line.isspace()]
+    
+    if not lines:
+        return []
+    
+    result = _loads_batch(lines)
+    if result is not None:
+        return result
+    
+    # Malformed line somewhere in the batch: isolate it
+    result = []
+    
+    for line in lines:
+        try:
+            result.append(orjson.loads(line))
+        except orjson.JSONDecodeError:
+            if not skip_errors:
+                raise
+            # Skip malformed JSON
+    
+    return result
+
+
+def _parse_buffer(buf: bytes, skip_errors: bool) -> list:
+    """_parse_batch over newline-joined lines (for worker processes)."""
+    return _parse_batch(buf.split(b'\n'), skip_errors)
+
+
+def _available_cpus() -> int:
+    """CPUs this process may run on (os.process_cpu_count on 3.13+)."""
+    count = getattr(os, 'process_cpu_count', os.cpu_count)()
+    return count or 1
+
+
+@functools.lru_cache(maxsize=None)
+def _parse_pool(workers: int) -> ProcessPoolExecutor:
+    """Shared process pool for JSONL parsing, created on first use."""
+    return ProcessPoolExecutor(max_workers=workers)
+
+
+# One JSON value per line: first and last non-space bytes must pair up
+# as value delimiters, and scalars may not contain brackets
+_JSONL_VALUE = re.compile(
+    rb'\s*(?:\{.*\}|\[.*\]|".*"|-?[0-9][-+.0-9eE]*|true|false|null)\s*',
+    re.DOTALL
+)
+
+
+def _loads_batch(lines: list[bytes]) -> Optional[list]:
+    """Parse non-blank JSONL lines with one orjson call.
+    
+    Each line is wrapped in its own one-element array. Lines that aren't
+    shaped like a single value are left to the per-line path up front,
+    since a line with stray delimiters (an unclosed string, a bare
+    "],[") could otherwise pair up with a neighbour into a valid but
+    wrongly split batch. The separator carries a newline, which JSON
+    forbids inside strings, so no string can swallow it. If the shape
+    still doesn't come out as one value per line, None is returned and
+    the caller parses line by line.
+    """
+    if not all(map(_JSONL_VALUE.fullmatch, lines)):
+        return None
+    
+    try:
+        parsed = orjson.loads(b'[[' + b']\n,['.join(lines) + b']]')
+    except orjson.JSONDecodeError:
+        return None
+    
+    if len(parsed) != len(lines):
+        return None
+    
+    result = []
+    for wrapped in parsed:
+        if len(wrapped) != 1:
+            return None
+        result.append(wrapped[0])
+    
+    return result
+
+
 async def stream_jsonl(
-    filepath: Path | str,
+    filepath: JsonlSource | Path | str,
     batch_size: int = 1000,
     skip_errors: bool = True,
-    decompress: bool = False
+    decompress: bool = False,
+    workers: Optional[int] = 1
 ) -> AsyncIterator[list[dict]]:
     """Stream JSONL file in batches (async generator).
     
     Yields batches instead of individual entries for better throughput.
-    Handles gzip-compressed files automatically.
+    Handles gzip-compressed files automatically. The next batch is read
+    in a worker thread while the current one is parsed.
     
     Args:
-        filepath: Path to JSONL file
+        filepath: Path to JSONL file, or a JsonlSource
         batch_size: Number of entries per batch
         skip_errors: Continue on JSON decode errors
         decompress: Force gzip decompression
+        workers: Parse processes; 1 parses in a thread, None uses every
+            available core. Parsed objects are pickled back from the
+            workers, so this only pays off when parsing is the bottleneck.
         
     Yields:
         list[dict]: Batch of parsed JSON objects
     """
     
-    filepath = Path(filepath)
+    source = _as_source(filepath)
     
     # Determine if file is compressed
-    is_compressed = decompress or filepath.suffix == '.gz'
+    is_compressed = decompress or source.is_gz
     
-    # Open file appropriately
-    open_fn = gzip.open if is_compressed else open
+    if workers is None:
+        workers = _available_cpus()
     
-    batch = []
-    
-    def process_batch():
-        """Process batch in thread pool (orjson parsing can be CPU-bound)."""
-        nonlocal batch
-        result = []
+    if workers > 1:
+        loop = asyncio.get_running_loop()
+        pool = _parse_pool(workers)
         
-        for line in batch:
-            if not line.strip():
-                continue
-            
-            try:
-                obj = orjson.loads(line)
-                result.append(obj)
-            except orjson.JSONDecodeError as e:
-                if not skip_errors:
-                    raise
-                # Skip malformed JSON
+        def submit(batch: list[bytes]) -> asyncio.Future:
+            # One joined buffer pickles far faster than a list of lines
+            return loop.run_in_executor(
+                pool, _parse_buffer, b'\n'.join(batch), skip_errors
+            )
+    else:
+        def submit(batch: list[bytes]) -> asyncio.Future:
+            return asyncio.ensure_future(
+                asyncio.to_thread(_parse_batch, batch, skip_errors)
+            )
+    
+    with _open_lines(source, is_compressed) as lines:
+        def read_batch() -> list[bytes]:
+            return list(islice(lines, batch_size))
         
-        batch = []
-        return result
-    
-    with open_fn(filepath, 'rb') as f:
-        for line in f:
-            batch.append(line)
+        pending = asyncio.ensure_future(asyncio.to_thread(read_batch))
+        parsing = deque()
+        
+        try:
+            while batch := await pending:
+                # Overlap the next read with parsing this batch
+                pending = asyncio.ensure_future(asyncio.to_thread(read_batch))
+                parsing.append(submit(batch))
+                
+                # Keep one batch per worker in flight; results stay in order
+                if len(parsing) >= workers:
+                    result = await parsing.popleft()
+                    if result:
+                        yield result
             
-            if len(batch) >= batch_size:
-                # Process batch in thread pool
-                result = await asyncio.to_thread(process_batch)
+            while parsing:
+                result = await parsing.popleft()
                 if result:
                     yield result
-                batch = []
-        
-        # Process remaining entries
-        if batch:
-            result = await asyncio.to_thread(process_batch)
-            if result:
-                yield result
+        finally:
+            # Let in-flight work finish before the file is closed
+            await asyncio.gather(pending, *parsing, return_exceptions=True)
 
 
 def stream_jsonl_sync(
-    filepath: Path | str,
-    skip_errors: bool = True
+    filepath: JsonlSource | Path | str,
+    skip_errors: bool = True,
+    batch_size: int = 1000
 ) -> Iterator[dict]:
     """Synchronous JSONL streaming (for non-async contexts).
     
-    Memory-efficient generator for line-by-line processing.
+    Memory-efficient generator; lines are parsed in batches of
+    batch_size.
     """
     
-    filepath = Path(filepath)
-    is_compressed = filepath.suffix == '.gz'
-    open_fn = gzip.open if is_compressed else open
+    source = _as_source(filepath)
     
-    with open_fn(filepath, 'rb') as f:
-        for line_num, line in enumerate(f, start=1):
-            if not line.strip():
+    with _open_lines(source, source.is_gz) as lines:
+        line_num = 0
+        
+        while chunk := list(islice(lines, batch_size)):
+            start = line_num + 1
+            line_num += len(chunk)
+            
+            batch = [line for line in chunk if line and not line.isspace()]
+            if not batch:
                 continue
             
-            try:
-                yield orjson.loads(line)
-            except orjson.JSONDecodeError as e:
-                if not skip_errors:
-                    raise ValueError(f"Invalid JSON at line {line_num}: {e}")
+            parsed = _loads_batch(batch)
+            if parsed is not None:
+                yield from parsed
+                continue
+            
+            for num, line in enumerate(chunk, start=start):
+                if not line or line.isspace():
+                    continue
+                
+                try:
+                    yield orjson.loads(line)
+                except orjson.JSONDecodeError as e:
+                    if not skip_errors:
+                        raise ValueError(f"Invalid JSON at line {num}: {e}")
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -173,24 +460,63 @@ async def map_concurrent(
     """
     
     semaphore = asyncio.Semaphore(max_concurrency)
-    tasks = []
+    tasks = deque()
     
     async def bounded_transform(item: T) -> T:
         async with semaphore:
             return await transform(item)
     
-    async for item in iterator:
-        task = asyncio.create_task(bounded_transform(item))
-        tasks.append(task)
+    try:
+        async for item in iterator:
+            task = asyncio.create_task(bounded_transform(item))
+            tasks.append(task)
+            
+            # Yield completed tasks
+            while tasks and tasks[0].done():
+                yield tasks.popleft().result()
         
-        # Yield completed tasks
-        while tasks and tasks[0].done():
-            result = await tasks.pop(0)
-            yield result
+        # Yield remaining tasks
+        while tasks:
+            yield await tasks.popleft()
+    finally:
+        # Consumer stopped early (or a transform failed)
+        for task in tasks:
+            task.cancel()
+
+
+async def map_concurrent_unordered(
+    iterator: AsyncIterator[T],
+    transform: Callable,
+    max_concurrency: int = 10
+) -> AsyncIterator[T]:
+    """Apply async transformation concurrently, yielding in completion order.
+    
+    Unlike map_concurrent, a slow item doesn't hold back results behind
+    it. At most max_concurrency transforms are in flight.
+    """
     
-    # Yield remaining tasks
-    for task in tasks:
-        yield await task
+    pending = set()
+    
+    try:
+        async for item in iterator:
+            if len(pending) >= max_concurrency:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    yield task.result()
+            
+            pending.add(asyncio.create_task(transform(item)))
+        
+        while pending:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                yield task.result()
+    finally:
+        for task in pending:
+            task.cancel()
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -236,36 +562,93 @@ async def track_progress(
 # CHECKPOINTING (Resumable processing)
 # ═══════════════════════════════════════════════════════════════════════
 
+def _hash64(key: str) -> int:
+    """64-bit hash of a string key (XXH3 when available, else BLAKE2b)."""
+    data = key.encode()
+    if XXHASH_AVAILABLE:
+        return xxhash.xxh3_64_intdigest(data)
+    return int.from_bytes(
+        hashlib.blake2b(data, digest_size=8).digest(), 'little'
+    )
+
+
+def _hash_set(hashes=()):
+    """Set of 64-bit hashes, as a roaring bitmap when pyroaring is installed."""
+    if PYROARING_AVAILABLE:
+        return BitMap64(hashes)
+    return set(hashes)
+
+
 class Checkpoint:
     """Resumable checkpoint for stream processing.
     
-    Saves progress to allow resuming after interruption.
+    Saves progress to allow resuming after interruption. IDs are kept as
+    64-bit hashes and appended to a binary log, so a save writes only
+    the IDs marked since the previous one. A legacy JSON checkpoint at
+    filepath is still read on load.
     """
     
     def __init__(self, filepath: Path | str):
         self.filepath = Path(filepath)
-        self.processed: set[str] = set()
+        
+        # The hash function is part of the log name: a log written with
+        # the other one is ignored (items get reprocessed, not skipped)
+        hash_name = 'xxh3' if XXHASH_AVAILABLE else 'blake2b'
+        self._log_path = self.filepath.with_name(
+            f"{self.filepath.name}.{hash_name}.log"
+        )
+        
+        self._processed = _hash_set()
+        self._pending = array('Q')
         self._load()
     
     def _load(self):
         """Load checkpoint from disk."""
+        hashes = array('Q')
+        
         if self.filepath.exists():
             with open(self.filepath, 'rb') as f:
-                self.processed = set(orjson.loads(f.read()))
+                hashes.extend(map(_hash64, orjson.loads(f.read())))
+        
+        if self._log_path.exists():
+            with open(self._log_path, 'rb') as f:
+                data = f.read()
+            
+            # Drop a record torn by a crash mid-write
+            hashes.frombytes(data[:len(data) - len(data) % hashes.itemsize])
+        
+        self._processed = _hash_set(hashes)
     
     def save(self):
-        """Save checkpoint to disk."""
-        self.filepath.parent.mkdir(parents=True, exist_ok=True)
-        with open(self.filepath, 'wb') as f:
-            f.write(orjson.dumps(list(self.processed)))
+        """Append IDs marked since the last save to disk."""
+        if not self._pending:
+            return
+        
+        self._log_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Pending records are one contiguous buffer, so a raw O_APPEND
+        # write is a single syscall with no file-object buffering
+        data = memoryview(self._pending).cast('B')
+        fd = os.open(self._log_path, os.O_WRONLY | os.O_CREAT | os.O_APPEND, 0o644)
+        try:
+            while data:
+                data = data[os.write(fd, data):]
+        finally:
+            os.close(fd)
+        
+        self._pending = array('Q')
     
     def mark_processed(self, id: str):
         """Mark item as processed."""
-        self.processed.add(id)
+        h = _hash64(id)
+        
+        if h not in self._processed:
+            self._processed.add(h)
+            self._pending.append(h)
     
     def is_processed(self, id: str) -> bool:
         """Check if item already processed."""
-        return id in self.processed
+        return _hash64(id) in self._processed
 
 
 async def with_checkpoint(
@@ -319,15 +702,39 @@ def sliding_window(
     Example:
         [1, 2, 3, 4] with window_size=2 yields:
         (1, 2), (2, 3), (3, 4)
+    
+    For numeric sequences already in memory, sliding_window_view avoids
+    building a tuple per step.
     """
     
-    window = deque(maxlen=window_size)
+    iterator = iter(iterator)
+    window = deque(islice(iterator, window_size), maxlen=window_size)
     
+    if len(window) < window_size:
+        return
+    
+    yield tuple(window)
+    
+    # The deque is full from here on, so no length check per item
     for item in iterator:
         window.append(item)
-        
-        if len(window) == window_size:
-            yield tuple(window)
+        yield tuple(window)
+
+
+def sliding_window_view(values, window_size: int) -> np.ndarray:
+    """Zero-copy sliding windows over an in-memory numeric sequence.
+    
+    Returns a read-only (n - window_size + 1, window_size) strided view;
+    row i is the window starting at values[i]. Lists are converted to
+    an array first.
+    """
+    values = np.asarray(values)
+    
+    # Like sliding_window, a short input has no windows (NumPy raises)
+    if len(values) < window_size:
+        return np.empty((0, window_size), dtype=values.dtype)
+    
+    return np.lib.stride_tricks.sliding_window_view(values, window_size)
 
 
 # ═══════════════════════════════════════════════════════════════════════
@@ -340,16 +747,17 @@ async def deduplicate(
 ) -> AsyncIterator[T]:
     """Remove duplicates from stream based on key function.
     
-    Warning: Keeps all seen keys in memory. For very large streams,
-    consider using a bloom filter or external deduplication.
+    Seen keys are kept as 64-bit hashes (a roaring bitmap when pyroaring
+    is installed) rather than strings, so memory stays at a few bytes
+    per key. Two distinct keys colliding is possible but negligible at
+    any realistic stream length.
     """
     
-    seen = set()
+    seen = _hash_set()
     
     async for item in iterator:
-        key = get_key(item)
+        h = _hash64(get_key(item))
         
-        if key not in seen:
-            seen.add(key)
+        if h not in seen:
+            seen.add(h)
             yield item
-
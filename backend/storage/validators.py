@@ -5,7 +5,11 @@ Composable validators following functional patterns.
 
 from typing import Protocol, Callable
 from dataclasses import dataclass
+from itertools import repeat
+from operator import attrgetter
 import re
+import sys
+import numpy as np
 from backend.core.types import Entry, Language
 
 
@@ -23,11 +27,20 @@ class RequiredField:
     
     field_name: str
     
+    def __post_init__(self):
+        object.__setattr__(self, '_get', attrgetter(self.field_name))
+        object.__setattr__(
+            self, 'message', sys.intern(f"{self.field_name} is required")
+        )
+    
     def __call__(self, entry: Entry) -> tuple[bool, str]:
-        value = getattr(entry, self.field_name, None)
+        try:
+            value = self._get(entry)
+        except AttributeError:
+            value = None
         
         if value is None or (isinstance(value, str) and not value.strip()):
-            return False, f"{self.field_name} is required"
+            return False, self.message
         
         return True, ""
 
@@ -39,11 +52,20 @@ class MinLength:
     field_name: str
     min_length: int
     
+    def __post_init__(self):
+        object.__setattr__(self, '_get', attrgetter(self.field_name))
+        object.__setattr__(self, 'message', sys.intern(
+            f"{self.field_name} must be at least {self.min_length} characters"
+        ))
+    
     def __call__(self, entry: Entry) -> tuple[bool, str]:
-        value = getattr(entry, self.field_name, "")
+        try:
+            value = self._get(entry)
+        except AttributeError:
+            value = ""
         
         if len(value) < self.min_length:
-            return False, f"{self.field_name} must be at least {self.min_length} characters"
+            return False, self.message
         
         return True, ""
 
@@ -55,11 +77,20 @@ class MaxLength:
     field_name: str
     max_length: int
     
+    def __post_init__(self):
+        object.__setattr__(self, '_get', attrgetter(self.field_name))
+        object.__setattr__(self, 'message', sys.intern(
+            f"{self.field_name} must be at most {self.max_length} characters"
+        ))
+    
     def __call__(self, entry: Entry) -> tuple[bool, str]:
-        value = getattr(entry, self.field_name, "")
+        try:
+            value = self._get(entry)
+        except AttributeError:
+            value = ""
         
         if len(value) > self.max_length:
-            return False, f"{self.field_name} must be at most {self.max_length} characters"
+            return False, self.message
         
         return True, ""
 
@@ -72,15 +103,43 @@ class RegexMatch:
     pattern: str
     description: str
     
+    def __post_init__(self):
+        object.__setattr__(self, '_get', attrgetter(self.field_name))
+        object.__setattr__(self, '_match', re.compile(self.pattern).match)
+        object.__setattr__(
+            self, 'message', sys.intern(f"{self.field_name} {self.description}")
+        )
+    
     def __call__(self, entry: Entry) -> tuple[bool, str]:
-        value = getattr(entry, self.field_name, "")
+        try:
+            value = self._get(entry)
+        except AttributeError:
+            value = ""
         
-        if not re.match(self.pattern, value):
-            return False, f"{self.field_name} {self.description}"
+        if not self._match(value):
+            return False, self.message
         
         return True, ""
 
 
+_IPA_EMPTY = sys.intern("IPA transcription is empty")
+_IPA_NUMERIC = sys.intern("IPA contains suspicious numeric characters")
+_IPA_UNBALANCED = sys.intern("IPA has unbalanced brackets")
+_IPA_VALID = (True, "")
+_IPA_EMPTY_RESULT = (False, _IPA_EMPTY)
+_IPA_NUMERIC_RESULT = (False, _IPA_NUMERIC)
+_IPA_UNBALANCED_RESULT = (False, _IPA_UNBALANCED)
+
+_IPA_DIGIT = re.compile(r'[0-9]').search
+_IPA_DIACRITIC = re.compile(r'[ː̯̥̆̊]').search
+
+# Diacritics that excuse digits (length mark and the combining marks in
+# IPAValidator's pattern), as (lead, continuation) UTF-8 byte pairs
+_IPA_DIACRITIC_BYTES = tuple(
+    tuple(c.encode()) for c in '\u02d0\u0306\u032f\u0325\u030a'
+)
+
+
 @dataclass(frozen=True)
 class IPAValidator:
     """Validates IPA transcription format."""
@@ -90,63 +149,135 @@ class IPAValidator:
         
         # Check for common errors
         if not ipa or not ipa.strip():
-            return False, "IPA transcription is empty"
+            return False, _IPA_EMPTY
         
         # Check for invalid characters (basic check)
-        if re.search(r'[0-9]', ipa) and not re.search(r'[ː̯̥̆̊]', ipa):
-            return False, "IPA contains suspicious numeric characters"
+        if _IPA_DIGIT(ipa) and not _IPA_DIACRITIC(ipa):
+            return False, _IPA_NUMERIC
         
         # Check for balanced brackets
         if ipa.count('[') != ipa.count(']'):
-            return False, "IPA has unbalanced brackets"
+            return False, _IPA_UNBALANCED
         
         return True, ""
 
 
+# Common ISO 639 codes for Indo-European
+_VALID_LANGUAGE_CODES = frozenset({
+    'en', 'de', 'nl', 'sv', 'no', 'da', 'is', 'fo',  # Germanic
+    'fr', 'es', 'it', 'pt', 'ro', 'ca', 'la',        # Romance
+    'ru', 'pl', 'cs', 'sk', 'uk', 'bg', 'lt', 'lv',  # Slavic/Baltic
+    'grc', 'el',                                      # Greek
+    'sa', 'hi', 'ur', 'fa', 'ku', 'ps',              # Indo-Iranian
+    'ga', 'cy', 'br', 'sga',                          # Celtic
+    'sq',                                             # Albanian
+    'hy',                                             # Armenian
+    'pie', 'ine',                                     # Proto-languages
+})
+
+
 @dataclass(frozen=True)
 class LanguageCodeValidator:
     """Validates ISO language codes."""
     
-    # Common ISO 639 codes for Indo-European
-    valid_codes = {
-        'en', 'de', 'nl', 'sv', 'no', 'da', 'is', 'fo',  # Germanic
-        'fr', 'es', 'it', 'pt', 'ro', 'ca', 'la',        # Romance
-        'ru', 'pl', 'cs', 'sk', 'uk', 'bg', 'lt', 'lv',  # Slavic/Baltic
-        'grc', 'el',                                      # Greek
-        'sa', 'hi', 'ur', 'fa', 'ku', 'ps',              # Indo-Iranian
-        'ga', 'cy', 'br', 'sga',                          # Celtic
-        'sq',                                             # Albanian
-        'hy',                                             # Armenian
-        'pie', 'ine',                                     # Proto-languages
-    }
+    valid_codes = _VALID_LANGUAGE_CODES
     
     def __call__(self, entry: Entry) -> tuple[bool, str]:
-        code = entry.language.lower()
+        code = entry.language
+        
+        # Codes are nearly always stored lowercase, so only pay for
+        # lower() when the direct lookup misses
+        if code in _VALID_LANGUAGE_CODES:
+            return True, ""
         
-        if code not in self.valid_codes:
+        code = code.lower()
+        
+        if code not in _VALID_LANGUAGE_CODES:
             return False, f"Unknown or non-Indo-European language code: {code}"
         
         return True, ""
 
 
+def _field_expr(field_name: str, default: str) -> str:
+    """Source for reading a field; direct attribute access for Entry fields."""
+    if field_name in Entry.model_fields:
+        return f"e.{field_name}"
+    return f"getattr(e, {field_name!r}, {default})"
+
+
+def _fuse_rules(rules: list[ValidationRule]) -> Callable:
+    """Compile a rule list into one function returning the error list.
+    
+    The built-in field rules are inlined with their parameters and
+    append the rule's own interned message; any other rule (including
+    subclasses) is called as-is, in order. The generated function takes an optional
+    precomputed IPAValidator result, as used by batch_validate.
+    """
+    lines = ["def _fused(e, ipa_result=None):", "    errors = []"]
+    namespace = {}
+    
+    for i, rule in enumerate(rules):
+        kind = type(rule)
+        
+        if kind in (RequiredField, MinLength, MaxLength, RegexMatch):
+            namespace[f"message_{i}"] = rule.message
+        
+        if kind is RequiredField:
+            lines += [
+                f"    v = {_field_expr(rule.field_name, 'None')}",
+                "    if v is None or (isinstance(v, str) and not v.strip()):",
+                f"        errors.append(message_{i})",
+            ]
+        elif kind is MinLength:
+            lines += [
+                f"    if len({_field_expr(rule.field_name, repr(''))}) < {rule.min_length!r}:",
+                f"        errors.append(message_{i})",
+            ]
+        elif kind is MaxLength:
+            lines += [
+                f"    if len({_field_expr(rule.field_name, repr(''))}) > {rule.max_length!r}:",
+                f"        errors.append(message_{i})",
+            ]
+        elif kind is RegexMatch:
+            namespace[f"match_{i}"] = rule._match
+            lines += [
+                f"    if not match_{i}({_field_expr(rule.field_name, repr(''))}):",
+                f"        errors.append(message_{i})",
+            ]
+        else:
+            namespace[f"rule_{i}"] = rule
+            if kind is IPAValidator:
+                call = f"rule_{i}(e) if ipa_result is None else ipa_result"
+            else:
+                call = f"rule_{i}(e)"
+            lines += [
+                f"    ok, error = {call}",
+                "    if not ok:",
+                "        errors.append(error)",
+            ]
+    
+    lines.append("    return errors")
+    exec(compile("\n".join(lines), "<fused validator>", "exec"), namespace)
+    return namespace["_fused"]
+
+
 class EntryValidator:
-    """Composite validator for Entry objects."""
+    """Composite validator for Entry objects.
+    
+    The rule list is compiled into a single function on construction.
+    """
     
     def __init__(self, rules: list[ValidationRule]):
         self._rules = rules
+        self._has_ipa_rule = any(type(r) is IPAValidator for r in rules)
+        self._errors = _fuse_rules(rules)
     
     def validate(self, entry: Entry) -> tuple[bool, list[str]]:
         """Validate entry against all rules.
         
         Returns (is_valid, error_messages).
         """
-        errors = []
-        
-        for rule in self._rules:
-            is_valid, error = rule(entry)
-            if not is_valid:
-                errors.append(error)
-        
+        errors = self._errors(entry)
         return len(errors) == 0, errors
     
     def batch_validate(
@@ -156,12 +287,69 @@ class EntryValidator:
         """Validate multiple entries, return map of ID to errors."""
         results = {}
         
-        for entry in entries:
-            is_valid, errors = self.validate(entry)
-            if not is_valid:
+        for entry, errors in zip(entries, self.batch_errors(entries)):
+            if errors:
                 results[entry.id] = errors
         
         return results
+    
+    def batch_errors(self, entries: list[Entry]) -> list[list[str]]:
+        """Validate multiple entries, return each one's errors in input order."""
+        if self._has_ipa_rule:
+            ipa_results = self.batch_validate_ipa([e.ipa for e in entries])
+        else:
+            ipa_results = repeat(None)
+        
+        errors = self._errors
+        return [errors(e, r) for e, r in zip(entries, ipa_results)]
+    
+    @staticmethod
+    def batch_validate_ipa(ipas: list[str]) -> list[tuple[bool, str]]:
+        """Apply IPAValidator's checks to many transcriptions at once.
+        
+        Digits, excusing diacritics and brackets are counted for the
+        whole batch in one NumPy pass over the concatenated UTF-8 bytes.
+        """
+        encoded = [ipa.encode() if ipa else b'' for ipa in ipas]
+        lengths = np.fromiter(map(len, encoded), dtype=np.int64, count=len(encoded))
+        ends = np.cumsum(lengths)
+        starts = ends - lengths
+        buf = np.frombuffer(b''.join(encoded), dtype=np.uint8)
+        
+        def per_entry(mask: np.ndarray) -> list[int]:
+            # Prefix sums handle empty strings, unlike np.add.reduceat
+            totals = np.concatenate(([0], np.cumsum(mask, dtype=np.int64)))
+            return (totals[ends] - totals[starts]).tolist()
+        
+        # Diacritics are matched as lead/continuation byte pairs; UTF-8 is
+        # self-synchronizing, so a pair never straddles two characters
+        diacritic = np.zeros(len(buf), dtype=bool)
+        for lead, cont in _IPA_DIACRITIC_BYTES:
+            diacritic[:-1] |= (buf[:-1] == lead) & (buf[1:] == cont)
+        
+        columns = zip(
+            ipas,
+            per_entry((buf >= 0x30) & (buf <= 0x39)),
+            per_entry(diacritic),
+            # '[' counts +1 and ']' -1, so one prefix sum gives the
+            # bracket balance instead of two separate counts
+            per_entry(
+                (buf == 0x5B).view(np.int8) - (buf == 0x5D).view(np.int8)
+            ),
+        )
+        
+        # Sized up front; most transcriptions pass, so only failures
+        # replace the shared valid result
+        results = [_IPA_VALID] * len(ipas)
+        for i, (ipa, digits, diacritics, balance) in enumerate(columns):
+            if not ipa or not ipa.strip():
+                results[i] = _IPA_EMPTY_RESULT
+            elif digits and not diacritics:
+                results[i] = _IPA_NUMERIC_RESULT
+            elif balance:
+                results[i] = _IPA_UNBALANCED_RESULT
+        
+        return results
 
 
 class ValidatorFactory:
@@ -229,3 +417,19 @@ def compute_quality_score(entry: Entry, validator: EntryValidator) -> float:
     penalty = min(0.15 * len(errors), 0.9)
     return 1.0 - penalty
 
+
+def compute_quality_score_batch(
+    entries: list[Entry],
+    validator: EntryValidator
+) -> np.ndarray:
+    """Quality scores for many entries, same scale as compute_quality_score.
+    
+    Validation runs through the batch path once; the penalty is applied
+    to all error counts in one vectorized step.
+    """
+    counts = np.fromiter(
+        map(len, validator.batch_errors(entries)),
+        dtype=np.float64,
+        count=len(entries)
+    )
+    return 1.0 - np.minimum(0.15 * counts, 0.9)
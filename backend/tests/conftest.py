@@ -0,0 +1,13 @@
+"""Shared pytest configuration.
+
+Markers split the suite by cost, so fast feedback can run
+``pytest -m "not slow and not integration"`` (with ``-n auto
+--dist loadscope`` when pytest-xdist is installed) and leave model
+loading and live services to a separate job.
+"""
+
+
+def pytest_configure(config):
+    config.addinivalue_line("markers", "unit: fast, dependency-free tests")
+    config.addinivalue_line("markers", "slow: loads ML models or other heavy resources")
+    config.addinivalue_line("markers", "integration: requires external services (R, databases)")
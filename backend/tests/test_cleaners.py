@@ -13,111 +13,145 @@ from backend.storage.cleaners import (
 )
 
 
+pytestmark = pytest.mark.unit
+
+
+_LONG_TEXT = "word " * 100
+
+
+@pytest.fixture(scope="module")
+def ipa_cleaner():
+    return IPACleaner()
+
+
+@pytest.fixture(scope="module")
+def text_normalizer():
+    return TextNormalizer()
+
+
+@pytest.fixture(scope="module")
+def headword_cleaner():
+    return HeadwordCleaner()
+
+
+@pytest.fixture(scope="module")
+def definition_cleaner():
+    return DefinitionCleaner()
+
+
+@pytest.fixture(scope="module")
+def language_code_cleaner():
+    return LanguageCodeCleaner()
+
+
+@pytest.fixture(scope="module")
+def pipeline(headword_cleaner, text_normalizer):
+    from backend.storage.pipeline import Pipeline
+    
+    return Pipeline([headword_cleaner, text_normalizer])
+
+
 class TestIPACleaner:
     """Test IPA cleaning and validation."""
     
-    def setup_method(self):
-        self.cleaner = IPACleaner()
+    @pytest.mark.parametrize("value, expected", [
+        ("[wódr̥]", "wódr̥"),
+        ("/wódr̥/", "wódr̥"),
+    ])
+    def test_removes_brackets(self, ipa_cleaner, value, expected):
+        assert ipa_cleaner.clean(value) == expected
     
-    def test_removes_brackets(self):
-        assert self.cleaner.clean("[wódr̥]") == "wódr̥"
-        assert self.cleaner.clean("/wódr̥/") == "wódr̥"
-    
-    def test_normalizes_unicode(self):
+    def test_normalizes_unicode(self, ipa_cleaner):
         # Test NFC normalization
         input_nfd = "wo\u0301dr\u0325"  # NFD: ó and ̥ as combining
-        result = self.cleaner.clean(input_nfd)
+        result = ipa_cleaner.clean(input_nfd)
         assert result == "wódr̥"
     
-    def test_removes_whitespace(self):
-        assert self.cleaner.clean("  wódr̥  ") == "wódr̥"
-        assert self.cleaner.clean("wó  dr̥") == "wó dr̥"
+    @pytest.mark.parametrize("value, expected", [
+        ("  wódr̥  ", "wódr̥"),
+        ("wó  dr̥", "wó dr̥"),
+    ])
+    def test_removes_whitespace(self, ipa_cleaner, value, expected):
+        assert ipa_cleaner.clean(value) == expected
     
-    def test_idempotent(self):
+    def test_idempotent(self, ipa_cleaner):
         """Cleaning twice should equal cleaning once."""
         value = "  [wódr̥]  "
-        once = self.cleaner.clean(value)
-        twice = self.cleaner.clean(once)
+        once = ipa_cleaner.clean(value)
+        twice = ipa_cleaner.clean(once)
         assert once == twice
     
-    def test_validation(self):
-        assert self.cleaner.validate("wódr̥") == True
-        assert self.cleaner.validate("aɪ") == True
-        assert self.cleaner.validate("") == False
+    def test_validation(self, ipa_cleaner):
+        assert ipa_cleaner.validate("wódr̥") == True
+        assert ipa_cleaner.validate("aɪ") == True
+        assert ipa_cleaner.validate("") == False
 
 
 class TestTextNormalizer:
     """Test text normalization."""
     
-    def setup_method(self):
-        self.cleaner = TextNormalizer()
-    
-    def test_lowercase(self):
-        result = self.cleaner.clean("HELLO World", lowercase=True)
+    def test_lowercase(self, text_normalizer):
+        result = text_normalizer.clean("HELLO World", lowercase=True)
         assert result == "hello world"
     
-    def test_preserve_case(self):
-        result = self.cleaner.clean("HELLO", lowercase=False)
+    def test_preserve_case(self, text_normalizer):
+        result = text_normalizer.clean("HELLO", lowercase=False)
         assert result == "HELLO"
     
-    def test_remove_punctuation(self):
-        result = self.cleaner.clean(
+    def test_remove_punctuation(self, text_normalizer):
+        result = text_normalizer.clean(
             "Hello, world!",
             remove_punctuation=True
         )
         assert result == "hello world"
     
-    def test_normalize_whitespace(self):
-        result = self.cleaner.clean("  hello   world  ")
+    def test_normalize_whitespace(self, text_normalizer):
+        result = text_normalizer.clean("  hello   world  ")
         assert result == "hello world"
     
-    def test_unicode_normalization(self):
+    def test_unicode_normalization(self, text_normalizer):
         # Test with different Unicode forms
         nfd = "café"  # é as combining character
-        result = self.cleaner.clean(nfd, unicode_form="NFC")
+        result = text_normalizer.clean(nfd, unicode_form="NFC")
         assert result == "café"
 
 
 class TestHeadwordCleaner:
     """Test headword cleaning."""
     
-    def setup_method(self):
-        self.cleaner = HeadwordCleaner()
+    @pytest.mark.parametrize("value, expected", [
+        ("*wódr̥", "wódr̥"),
+        ("†obsolete", "obsolete"),
+    ])
+    def test_removes_markers(self, headword_cleaner, value, expected):
+        assert headword_cleaner.clean(value) == expected
     
-    def test_removes_markers(self):
-        assert self.cleaner.clean("*wódr̥") == "wódr̥"
-        assert self.cleaner.clean("†obsolete") == "obsolete"
+    @pytest.mark.parametrize("value", ["word (alt)", "word (1)"])
+    def test_removes_parentheticals(self, headword_cleaner, value):
+        assert headword_cleaner.clean(value) == "word"
     
-    def test_removes_parentheticals(self):
-        assert self.cleaner.clean("word (alt)") == "word"
-        assert self.cleaner.clean("word (1)") == "word"
-    
-    def test_normalizes_unicode(self):
-        result = self.cleaner.clean("wo\u0301rd")
+    def test_normalizes_unicode(self, headword_cleaner):
+        result = headword_cleaner.clean("wo\u0301rd")
         assert "word" in result or "wórd" in result
 
 
 class TestDefinitionCleaner:
     """Test definition cleaning."""
     
-    def setup_method(self):
-        self.cleaner = DefinitionCleaner()
-    
-    def test_removes_citations(self):
+    @pytest.mark.parametrize("citation", ["[1]", "[2]"])
+    def test_removes_citations(self, definition_cleaner, citation):
         text = "Definition with citation[1] and another[2]."
-        result = self.cleaner.clean(text)
-        assert "[1]" not in result
-        assert "[2]" not in result
+        assert citation not in definition_cleaner.clean(text)
     
-    def test_removes_html(self):
+    def test_removes_html(self, definition_cleaner):
         text = "Definition with <b>bold</b> text."
-        result = self.cleaner.clean(text)
+        result = definition_cleaner.clean(text)
         assert "<b>" not in result
         assert result == "Definition with bold text."
     
-    def test_truncation(self):
-        long_text = "word " * 100
-        result = self.cleaner.clean(long_text, max_length=50)
+    def test_truncation(self, definition_cleaner):
+        long_text = _LONG_TEXT
+        result = definition_cleaner.clean(long_text, max_length=50)
         assert len(result) <= 53  # +3 for "..."
         assert result.endswith("...")
 
@@ -125,66 +159,108 @@ class TestDefinitionCleaner:
 class TestLanguageCodeCleaner:
     """Test language code normalization."""
     
-    def setup_method(self):
-        self.cleaner = LanguageCodeCleaner()
-    
-    def test_full_name_to_code(self):
-        assert self.cleaner.clean("English") == "en"
-        assert self.cleaner.clean("german") == "de"
-        assert self.cleaner.clean("LATIN") == "la"
+    @pytest.mark.parametrize("value, expected", [
+        ("English", "en"),
+        ("german", "de"),
+        ("LATIN", "la"),
+    ])
+    def test_full_name_to_code(self, language_code_cleaner, value, expected):
+        assert language_code_cleaner.clean(value) == expected
     
-    def test_preserves_iso_codes(self):
-        assert self.cleaner.clean("en") == "en"
-        assert self.cleaner.clean("grc") == "grc"
+    def test_preserves_iso_codes(self, language_code_cleaner):
+        assert language_code_cleaner.clean("en") == "en"
+        assert language_code_cleaner.clean("grc") == "grc"
     
-    def test_validation(self):
-        assert self.cleaner.validate("en") == True
-        assert self.cleaner.validate("grc") == True
-        assert self.cleaner.validate("xyz") == False
-        assert self.cleaner.validate("English") == False
+    def test_validation(self, language_code_cleaner):
+        assert language_code_cleaner.validate("en") == True
+        assert language_code_cleaner.validate("grc") == True
+        assert language_code_cleaner.validate("xyz") == False
+        assert language_code_cleaner.validate("English") == False
 
 
 class TestCleanerComposition:
     """Test composing multiple cleaners."""
     
-    def test_pipeline_composition(self):
-        from backend.storage.pipeline import Pipeline
-        
-        pipeline = Pipeline([
-            HeadwordCleaner(),
-            TextNormalizer(),
-        ])
-        
+    def test_pipeline_composition(self, pipeline):
         result, steps = pipeline.apply("  *Word (alt)  ")
         
         assert result == "word"
         assert len(steps) == 2
         assert steps[0].name == "headword_cleaner"
         assert steps[1].name == "text_normalizer"
+    
+    def test_parallel_batch_apply_preserves_order(self, pipeline):
+        values = [f"*Word{i} (alt)" for i in range(50)]
+        
+        sequential = pipeline.batch_apply(values, track_provenance=False)
+        parallel = pipeline.batch_apply(
+            values, workers=2, chunksize=8, track_provenance=False
+        )
+        
+        assert parallel == sequential
+        assert parallel[0] == ("word0", None)
+    
+    def test_builder_matches_add(self):
+        from backend.storage.pipeline import Pipeline, PipelineBuilder
+        
+        built = PipelineBuilder().add(HeadwordCleaner()).add(TextNormalizer()).freeze()
+        added = Pipeline().add(HeadwordCleaner()).add(TextNormalizer())
+        
+        assert built == added
+        assert built.signature == "headword_cleaner:1.0.0_text_normalizer:1.0.0"
+    
+    def test_validate_all_reports_failures(self, pipeline):
+        errors = pipeline.validate_all(["water", "", "fire", "(alt)"])
+        
+        assert [idx for idx, _ in errors] == [1, 3]
+        assert errors[0][1].startswith("Validation failed after headword_cleaner")
+    
+    @pytest.mark.parametrize("params", [
+        {},
+        {"lowercase": False, "unicode_form": "NFD"},
+        {"remove_punctuation": True},
+    ])
+    def test_arrow_matches_apply(self, pipeline, params):
+        pa = pytest.importorskip("pyarrow")
+        values = [
+            "  *Café\u00a0(alt) ", "Hello,\tWorld!", "e\u0301\u2003x_1",
+            "ΣΟΦΟΣ", "İstanbul", "İ",
+        ]
+        
+        arrow = pipeline.batch_apply_arrow(pa.array(values + [None]), **params)
+        expected = [pipeline.apply(v, track_provenance=False, **params)[0] for v in values]
+        
+        assert arrow.to_pylist() == expected + [None]
 
 
 # Property-based tests (if hypothesis is installed)
 try:
-    from hypothesis import given, strategies as st
+    from hypothesis import Phase, given, settings, strategies as st
+    
+    # Bounded, generate-only runs keep these in unit-test time; surrogates
+    # are excluded since they cannot be NFC-normalized meaningfully
+    _PROPERTY_SETTINGS = settings(
+        max_examples=25, deadline=None, phases=[Phase.generate]
+    )
+    _CHARS = st.characters(blacklist_categories=("Cs",))
     
     class TestCleanerProperties:
         """Property-based tests for cleaners."""
         
-        @given(st.text())
-        def test_text_normalizer_idempotent(self, text):
+        @_PROPERTY_SETTINGS
+        @given(st.text(_CHARS, max_size=64))
+        def test_text_normalizer_idempotent(self, text_normalizer, text):
             """Normalizing twice should equal normalizing once."""
-            cleaner = TextNormalizer()
-            once = cleaner.clean(text)
-            twice = cleaner.clean(once)
+            once = text_normalizer.clean(text)
+            twice = text_normalizer.clean(once)
             assert once == twice
         
-        @given(st.text(min_size=1))
-        def test_cleaner_preserves_type(self, text):
+        @_PROPERTY_SETTINGS
+        @given(st.text(_CHARS, min_size=1, max_size=64))
+        def test_cleaner_preserves_type(self, text_normalizer, text):
             """Cleaners should preserve type."""
-            cleaner = TextNormalizer()
-            result = cleaner.clean(text)
+            result = text_normalizer.clean(text)
             assert isinstance(result, str)
 
 except ImportError:
     pass  # hypothesis not installed
-
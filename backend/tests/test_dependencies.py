@@ -3,6 +3,9 @@
 Verifies that singleton pattern works correctly and services are reused.
 """
 
+import re
+
+import numpy as np
 import pytest
 from backend.api.dependencies import (
     ServiceContainer,
@@ -12,18 +15,51 @@ from backend.api.dependencies import (
 )
 
 
-class TestServiceContainer:
-    """Test singleton service container behavior."""
+_NOT_INIT_RE = re.compile("not initialized")
+
+
+@pytest.fixture(scope="session", autouse=True)
+def _services():
+    """Initialize services once for the whole session.
     
-    @classmethod
-    def setup_class(cls):
-        """Initialize services once for all tests."""
-        ServiceContainer.initialize()
+    The semantic model loads lazily, on the first test that needs it.
+    """
+    ServiceContainer.initialize(lazy=True)
+    yield
+    ServiceContainer.cleanup()
+
+
+_SEEDED_TEXTS = ("test", "test text")
+
+
+@pytest.fixture(scope="session")
+def semantic(_services):
+    """Semantic service with the texts used below already embedded.
     
-    @classmethod
-    def teardown_class(cls):
-        """Clean up services after all tests."""
-        ServiceContainer.cleanup()
+    The model runs once per session here; tests then only hit the cache.
+    """
+    service = get_semantic_service()
+    for text in _SEEDED_TEXTS:
+        service.get_embedding(text)
+    return service
+
+
+@pytest.fixture
+def uninitialized(monkeypatch):
+    """Empty the container for one test, restoring the session services after."""
+    for attr in (
+        "_phonetic_service",
+        "_semantic_service",
+        "_cognate_service",
+        "_phylo_service",
+    ):
+        monkeypatch.setattr(ServiceContainer, attr, None)
+    monkeypatch.setattr(ServiceContainer, "_lazy", False)
+
+
+@pytest.mark.slow
+class TestServiceContainer:
+    """Test singleton service container behavior."""
     
     def test_phonetic_service_is_singleton(self):
         """Verify PhoneticService returns same instance."""
@@ -59,10 +95,9 @@ class TestServiceContainer:
         assert cognate._phonetic is phonetic
         assert cognate._semantic is semantic
     
-    def test_services_are_functional(self):
+    def test_services_are_functional(self, semantic):
         """Verify services can actually perform their operations."""
         phonetic = get_phonetic_service()
-        semantic = get_semantic_service()
         
         # Verify phonetic service is initialized
         assert phonetic._feature_table is not None
@@ -70,68 +105,39 @@ class TestServiceContainer:
         # Test semantic service (this is the expensive one we're optimizing)
         embedding = semantic.get_embedding("test")
         assert isinstance(embedding, list)
-        assert len(embedding) > 0
-        assert all(isinstance(x, float) for x in embedding)
+        values = np.asarray(embedding)
+        assert values.ndim == 1 and values.size > 0
+        assert values.dtype.kind == 'f'
     
-    def test_error_when_not_initialized(self):
+    def test_error_when_not_initialized(self, uninitialized):
         """Verify proper error when accessing uninitialized services."""
-        ServiceContainer.cleanup()  # Clear services
-        
-        with pytest.raises(RuntimeError, match="not initialized"):
+        with pytest.raises(RuntimeError, match=_NOT_INIT_RE):
             get_phonetic_service()
         
-        with pytest.raises(RuntimeError, match="not initialized"):
+        with pytest.raises(RuntimeError, match=_NOT_INIT_RE):
             get_semantic_service()
         
-        with pytest.raises(RuntimeError, match="not initialized"):
+        with pytest.raises(RuntimeError, match=_NOT_INIT_RE):
             get_cognate_service()
-        
-        # Re-initialize for other tests
-        ServiceContainer.initialize()
 
 
+@pytest.mark.slow
 class TestPerformanceImprovement:
     """Test that singleton pattern provides performance benefits."""
     
-    @classmethod
-    def setup_class(cls):
-        """Initialize services."""
-        ServiceContainer.initialize()
-    
-    @classmethod
-    def teardown_class(cls):
-        """Clean up services."""
-        ServiceContainer.cleanup()
-    
     def test_semantic_model_loaded_once(self):
         """Verify semantic model is loaded only once, not per-access."""
-        import time
-        
-        # First access (should be fast since already initialized)
-        start = time.time()
         service1 = get_semantic_service()
-        first_time = time.time() - start
-        
-        # Second access (should be equally fast)
-        start = time.time()
         service2 = get_semantic_service()
-        second_time = time.time() - start
-        
-        # Both should be very fast (< 1ms) since model is already loaded
-        assert first_time < 0.01, f"First access too slow: {first_time}s"
-        assert second_time < 0.01, f"Second access too slow: {second_time}s"
         
-        # And they should be the same instance
+        # Identity proves the singleton without a wall-clock threshold
         assert service1 is service2
+        assert service1._model is service2._model
     
-    def test_embedding_cache_works(self):
+    def test_embedding_cache_works(self, semantic):
         """Verify semantic service caching works correctly."""
-        semantic = get_semantic_service()
-        
-        # First embedding
+        # Both lookups hit the entry seeded by the fixture
         emb1 = semantic.get_embedding("test text")
-        
-        # Second embedding of same text (should be cached)
         emb2 = semantic.get_embedding("test text")
         
         # Should be identical (from cache)
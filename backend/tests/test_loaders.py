@@ -0,0 +1,150 @@
+"""Test suite for source loaders."""
+
+import os
+import threading
+
+import pytest
+from backend.storage import loaders
+from backend.storage._hash import _checksum
+from backend.storage.loaders import (
+    DedupTracker,
+    JSONLoader,
+    LoaderFactory,
+    StarlingLoader,
+    SwadeshLoader,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+SWADESH_CSV = "concept,en,de\nwater,water,-\nfire, fire ,Feuer\n"
+
+
+class TestSwadeshLoader:
+    """Test Swadesh wordlist loading."""
+
+    @pytest.fixture
+    def csv_path(self, tmp_path):
+        path = tmp_path / "swadesh.csv"
+        path.write_text(SWADESH_CSV, encoding="utf-8")
+        return str(path)
+
+    def test_skips_missing_words(self, csv_path):
+        entries = list(SwadeshLoader().load(csv_path, "swadesh"))
+
+        assert [(e.data['headword'], e.data['language']) for e in entries] == [
+            ("water", "en"),
+            ("fire", "en"),
+            ("Feuer", "de"),
+        ]
+        assert [e.line_number for e in entries] == [2, 3, 3]
+
+    def test_checksum_is_canonical(self, csv_path):
+        for entry in SwadeshLoader().load(csv_path, "swadesh"):
+            assert entry.checksum == _checksum(entry.data)
+
+    def test_columnar_matches_row_reader(self, csv_path, monkeypatch):
+        pytest.importorskip("pyarrow")
+        columnar = list(SwadeshLoader().load(csv_path, "swadesh"))
+
+        monkeypatch.setattr(loaders, "PYARROW_AVAILABLE", False)
+        rows = list(SwadeshLoader().load(csv_path, "swadesh"))
+
+        assert columnar == rows
+
+    @pytest.mark.parametrize("text, expected", [
+        ("concept,eng,deu\nfire,fire\nwater,water,Wasser\n",
+         [("fire", "eng"), ("water", "eng"), ("Wasser", "deu")]),
+        ("", []),
+    ], ids=["ragged", "empty"])
+    def test_irregular_sheets_match_row_reader(self, tmp_path, monkeypatch, text, expected):
+        path = tmp_path / "swadesh.csv"
+        path.write_text(text, encoding="utf-8")
+
+        columnar = list(SwadeshLoader().load(str(path), "swadesh"))
+        monkeypatch.setattr(loaders, "PYARROW_AVAILABLE", False)
+        rows = list(SwadeshLoader().load(str(path), "swadesh"))
+
+        assert [(e.data['headword'], e.data['language']) for e in columnar] == expected
+        assert [e.data for e in columnar] == [e.data for e in rows]
+
+    @pytest.mark.skipif(not hasattr(os, "mkfifo"), reason="Needs named pipes")
+    @pytest.mark.parametrize("pyarrow", [True, False])
+    def test_reads_from_pipe(self, tmp_path, monkeypatch, pyarrow):
+        # Read-ahead hints fail with ESPIPE on pipes and must be ignored,
+        # and a pipe can only be opened and read once
+        monkeypatch.setattr(loaders, "PYARROW_AVAILABLE", pyarrow and loaders.PYARROW_AVAILABLE)
+        path = tmp_path / "swadesh.csv"
+        os.mkfifo(path)
+
+        writer = threading.Thread(target=path.write_text, args=(SWADESH_CSV,))
+        writer.start()
+        entries = list(SwadeshLoader().load(str(path), "swadesh"))
+        writer.join()
+
+        assert [e.data['headword'] for e in entries] == ["water", "fire", "Feuer"]
+
+
+class TestStarlingLoader:
+    """Test the Python fallback for Starling/Toolbox files."""
+
+    def test_python_fallback(self, tmp_path):
+        path = tmp_path / "dict.txt"
+        path.write_text(
+            "\\lx wódr̥\n\\ph [wódr̥]\n\\de water\n\n"
+            "\\lx pater\r\n  \\lg la\r\n\\ps n\r\n",
+            encoding="utf-8",
+        )
+
+        entries = list(StarlingLoader(use_grpc=False).load(str(path), "starling"))
+
+        assert [e.data for e in entries] == [
+            {'headword': 'wódr̥', 'ipa': 'wódr̥', 'definition': 'water'},
+            {'headword': 'pater', 'language': 'la', 'pos_tag': 'n'},
+        ]
+        assert [e.line_number for e in entries] == [1, 5]
+
+
+class TestJSONLoader:
+    """Test generic JSON loading."""
+
+    @pytest.mark.parametrize("document", [
+        '[{"headword": "water", "weight": 1.5}, {"headword": "fire"}]',
+        '{"entries": [{"headword": "water", "weight": 1.5}, {"headword": "fire"}]}',
+    ])
+    def test_streaming_matches_full_parse(self, tmp_path, monkeypatch, document):
+        pytest.importorskip("ijson")
+        path = tmp_path / "dict.json"
+        path.write_text(document, encoding="utf-8")
+
+        streamed = list(JSONLoader().load(str(path), "json"))
+
+        monkeypatch.setattr(loaders, "IJSON_AVAILABLE", False)
+        parsed = list(JSONLoader().load(str(path), "json"))
+
+        assert streamed == parsed
+        assert [e.data['headword'] for e in streamed] == ["water", "fire"]
+
+
+class TestDedupTracker:
+    """Test near-duplicate collapsing across loads."""
+
+    @pytest.mark.parametrize("minhash", [True, False])
+    def test_duplicates_take_first_checksum(self, tmp_path, monkeypatch, minhash):
+        if minhash:
+            pytest.importorskip("datasketch")
+        else:
+            monkeypatch.setattr(loaders, "DATASKETCH_AVAILABLE", False)
+
+        path = tmp_path / "swadesh.csv"
+        path.write_text(SWADESH_CSV, encoding="utf-8")
+
+        dedup = DedupTracker()
+        loader = LoaderFactory.get_loader("swadesh", dedup=dedup)
+        first = list(loader.load(str(path), "swadesh"))
+        second = list(loader.load(str(path), "swadesh"))
+
+        assert not any(e.is_near_dup for e in first)
+        assert all(e.is_near_dup for e in second)
+        assert [e.checksum for e in second] == [e.checksum for e in first]
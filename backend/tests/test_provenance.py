@@ -0,0 +1,54 @@
+"""Test suite for provenance records."""
+
+import pytest
+from backend.storage.provenance import (
+    DataQuality,
+    Provenance,
+    Source,
+    SourceType,
+    TransformStep,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+SOURCE = Source(
+    id="swadesh",
+    name="Swadesh lists",
+    type=SourceType.COMPARATIVE_WORDLIST,
+    format="csv",
+    url="https://example.org/swadesh",
+    languages=["en", "de"],
+    license="CC-BY-4.0",
+    quality=DataQuality.HIGH,
+)
+
+
+def step(name: str, version: str = "1.0.0") -> TransformStep:
+    return TransformStep(id=name, name=name, version=version, parameters={})
+
+
+class TestProvenance:
+    """Test pipeline version derivation."""
+
+    @pytest.fixture
+    def record(self):
+        return Provenance(
+            record_id="r1",
+            source=SOURCE,
+            transforms=[step("headword_cleaner")],
+            checksum="b3:00",
+        )
+
+    def test_pipeline_version(self, record):
+        assert record.pipeline_version == "swadesh_headword_cleaner:1.0.0"
+
+    def test_copy_with_new_transforms_rebuilds_version(self, record):
+        # Read first, so a cached value would be carried into the copy
+        assert record.pipeline_version == "swadesh_headword_cleaner:1.0.0"
+
+        copy = record.model_copy(update={"transforms": [step("ipa_cleaner", "2.0.0")]})
+
+        assert copy.pipeline_version == "swadesh_ipa_cleaner:2.0.0"
+        assert record.pipeline_version == "swadesh_headword_cleaner:1.0.0"
@@ -4,6 +4,9 @@ Tests the full Python <-> R communication stack.
 Requires R service to be running (or mocks for CI).
 """
 
+import os
+import struct
+
 import pytest
 import numpy as np
 from unittest.mock import Mock, patch, MagicMock
@@ -18,6 +21,97 @@ from backend.interop.r_client import (
 from backend.services.phylo import PhyloService, create_distance_matrix_from_similarities
 
 
+def _read_only(rows: list[list[float]]) -> np.ndarray:
+    """Build a distance matrix that tests can share but not mutate.
+    
+    Packed once into little-endian float64 bytes; an array viewing an
+    immutable bytes object is read-only by construction.
+    """
+    n = len(rows)
+    packed = struct.pack(f"<{n * n}d", *(x for row in rows for x in row))
+    return np.frombuffer(packed, dtype="<f8").reshape(n, n)
+
+
+_D2 = _read_only([[0.0, 0.3], [0.3, 0.0]])
+
+_D3 = _read_only([
+    [0.0, 0.3, 0.5],
+    [0.3, 0.0, 0.4],
+    [0.5, 0.4, 0.0]
+])
+
+_D4 = _read_only([
+    [0.0, 0.3, 0.5, 0.7],
+    [0.3, 0.0, 0.4, 0.6],
+    [0.5, 0.4, 0.0, 0.5],
+    [0.7, 0.6, 0.5, 0.0]
+])
+
+# Two tight pairs, far apart
+_D4_CLUSTERED = _read_only([
+    [0.0, 0.2, 0.8, 0.9],
+    [0.2, 0.0, 0.7, 0.8],
+    [0.8, 0.7, 0.0, 0.1],
+    [0.9, 0.8, 0.1, 0.0]
+])
+
+# Indo-European language distances (simplified)
+_D5_INDO_EUROPEAN = _read_only([
+    [0.0, 0.25, 0.50, 0.60, 0.70],  # English
+    [0.25, 0.0, 0.45, 0.55, 0.65],  # German
+    [0.50, 0.45, 0.0, 0.30, 0.40],  # French
+    [0.60, 0.55, 0.30, 0.0, 0.35],  # Spanish
+    [0.70, 0.65, 0.40, 0.35, 0.0]   # Italian
+])
+
+# Cognate distances
+_D4_COGNATES = _read_only([
+    [0.0, 0.1, 0.8, 0.9],
+    [0.1, 0.0, 0.7, 0.8],
+    [0.8, 0.7, 0.0, 0.1],
+    [0.9, 0.8, 0.1, 0.0]
+])
+
+
+@pytest.fixture
+def mocked_client(monkeypatch):
+    """Client whose transport is replaced by a Mock; no socket is opened."""
+    client = RPhyloClient()
+    monkeypatch.setattr(client, "_call", Mock())
+    return client
+
+
+@pytest.fixture
+def service_r_client(monkeypatch):
+    """Mock client handed out by PhyloService's `with RPhyloClient(...)`."""
+    client = MagicMock()
+    context = MagicMock()
+    context.__enter__.return_value = client
+    monkeypatch.setattr(
+        "backend.services.phylo.RPhyloClient", lambda *args, **kwargs: context
+    )
+    return client
+
+
+@pytest.fixture
+def make_mock_tree():
+    """Factory for PhylogeneticTree results; defaults to a two-tip NJ tree."""
+    def _make(**overrides) -> PhylogeneticTree:
+        fields = dict(
+            newick="(en,de);",
+            method="nj",
+            n_tips=2,
+            tip_labels=["en", "de"],
+            edge_lengths=[0.15],
+            cophenetic_correlation=1.0,
+            rooted=False,
+            binary=True
+        )
+        fields.update(overrides)
+        return PhylogeneticTree(**fields)
+    return _make
+
+
 class TestRPhyloClient:
     """Test R client communication (mocked)."""
     
@@ -42,136 +136,107 @@ class TestRPhyloClient:
             client.disconnect()
             mock_sock_instance.close.assert_called_once()
     
-    def test_ping(self):
+    @pytest.mark.parametrize("response, expected", [
+        ({"status": "ok", "message": "R phylo service is running"}, True),
+        ({"status": "error", "message": "R phylo service is down"}, False),
+    ])
+    def test_ping(self, mocked_client, response, expected):
         """Test ping method."""
-        client = RPhyloClient()
+        mocked_client._call.return_value = response
         
-        with patch.object(client, '_call') as mock_call:
-            mock_call.return_value = {"status": "ok", "message": "R phylo service is running"}
-            
-            result = client.ping()
-            
-            assert result is True
-            mock_call.assert_called_once_with("ping", {})
+        result = mocked_client.ping()
+        
+        assert result is expected
+        mocked_client._call.assert_called_once_with("ping", {})
     
-    def test_infer_tree(self):
+    def test_infer_tree(self, mocked_client):
         """Test tree inference."""
-        client = RPhyloClient()
-        
-        # Sample distance matrix
-        distances = np.array([
-            [0.0, 0.3, 0.5, 0.7],
-            [0.3, 0.0, 0.4, 0.6],
-            [0.5, 0.4, 0.0, 0.5],
-            [0.7, 0.6, 0.5, 0.0]
-        ])
-        
+        distances = _D4
         labels = ["en", "de", "fr", "hi"]
         
-        with patch.object(client, '_call') as mock_call:
-            mock_call.return_value = {
-                "newick": "((en:0.15,de:0.15):0.25,(fr:0.20,hi:0.20):0.20);",
-                "method": "nj",
-                "n_tips": 4,
-                "tip_labels": labels,
-                "edge_lengths": [0.15, 0.15, 0.25, 0.20, 0.20, 0.20],
-                "cophenetic_correlation": 0.95,
-                "rooted": False,
-                "binary": True
-            }
-            
-            tree = client.infer_tree(distances, labels, method="nj")
-            
-            assert isinstance(tree, PhylogeneticTree)
-            assert tree.method == "nj"
-            assert tree.n_tips == 4
-            assert tree.cophenetic_correlation == 0.95
-            assert "en" in tree.tip_labels
-            
-            # Verify call
-            call_args = mock_call.call_args[0]
-            assert call_args[0] == "infer_tree"
-            assert call_args[1]["method"] == "nj"
-            assert call_args[1]["labels"] == labels
+        mocked_client._call.return_value = {
+            "newick": "((en:0.15,de:0.15):0.25,(fr:0.20,hi:0.20):0.20);",
+            "method": "nj",
+            "n_tips": 4,
+            "tip_labels": labels,
+            "edge_lengths": [0.15, 0.15, 0.25, 0.20, 0.20, 0.20],
+            "cophenetic_correlation": 0.95,
+            "rooted": False,
+            "binary": True
+        }
+        
+        tree = mocked_client.infer_tree(distances, labels, method="nj")
+        
+        assert isinstance(tree, PhylogeneticTree)
+        assert tree.method == "nj"
+        assert tree.n_tips == 4
+        assert tree.cophenetic_correlation == 0.95
+        assert "en" in tree.tip_labels
+        
+        # Verify call
+        call_args = mocked_client._call.call_args[0]
+        assert call_args[0] == "infer_tree"
+        assert call_args[1]["method"] == "nj"
+        assert call_args[1]["labels"] == labels
     
-    def test_bootstrap_tree(self):
+    def test_bootstrap_tree(self, mocked_client):
         """Test bootstrap analysis."""
-        client = RPhyloClient()
+        distances = _D3
+        labels = ["en", "de", "fr"]
         
-        distances = np.array([
-            [0.0, 0.3, 0.5],
-            [0.3, 0.0, 0.4],
-            [0.5, 0.4, 0.0]
-        ])
+        mocked_client._call.return_value = {
+            "consensus_newick": "((en,de),fr);",
+            "support_values": [0.85, 0.92, 1.0],
+            "n_bootstrap": 100,
+            "method": "nj"
+        }
         
-        labels = ["en", "de", "fr"]
+        result = mocked_client.bootstrap_tree(distances, labels, n_bootstrap=100)
         
-        with patch.object(client, '_call') as mock_call:
-            mock_call.return_value = {
-                "consensus_newick": "((en,de),fr);",
-                "support_values": [0.85, 0.92, 1.0],
-                "n_bootstrap": 100,
-                "method": "nj"
-            }
-            
-            result = client.bootstrap_tree(distances, labels, n_bootstrap=100)
-            
-            assert isinstance(result, BootstrapResult)
-            assert result.n_bootstrap == 100
-            assert len(result.support_values) == 3
-            assert result.method == "nj"
+        assert isinstance(result, BootstrapResult)
+        assert result.n_bootstrap == 100
+        assert len(result.support_values) == 3
+        assert result.method == "nj"
     
-    def test_hierarchical_clustering(self):
+    def test_hierarchical_clustering(self, mocked_client):
         """Test hierarchical clustering."""
-        client = RPhyloClient()
-        
-        distances = np.array([
-            [0.0, 0.2, 0.8, 0.9],
-            [0.2, 0.0, 0.7, 0.8],
-            [0.8, 0.7, 0.0, 0.1],
-            [0.9, 0.8, 0.1, 0.0]
-        ])
-        
+        distances = _D4_CLUSTERED
         labels = ["word1", "word2", "word3", "word4"]
         
-        with patch.object(client, '_call') as mock_call:
-            mock_call.return_value = {
-                "method": "ward.D2",
-                "labels": labels,
-                "merge": [[-1, -2], [-3, -4], [1, 2]],
-                "height": [0.2, 0.1, 0.8],
-                "order": [0, 1, 2, 3],
-                "suggested_k_range": [2, 4]
-            }
-            
-            result = client.cluster_hierarchical(distances, labels)
-            
-            assert isinstance(result, HierarchicalClustering)
-            assert result.method == "ward.D2"
-            assert result.suggested_k_range == (2, 4)
-            assert len(result.height) == 3
+        mocked_client._call.return_value = {
+            "method": "ward.D2",
+            "labels": labels,
+            "merge": [[-1, -2], [-3, -4], [1, 2]],
+            "height": [0.2, 0.1, 0.8],
+            "order": [0, 1, 2, 3],
+            "suggested_k_range": [2, 4]
+        }
+        
+        result = mocked_client.cluster_hierarchical(distances, labels)
+        
+        assert isinstance(result, HierarchicalClustering)
+        assert result.method == "ward.D2"
+        assert result.suggested_k_range == (2, 4)
+        assert len(result.height) == 3
     
-    def test_compare_trees(self):
+    def test_compare_trees(self, mocked_client):
         """Test tree comparison."""
-        client = RPhyloClient()
-        
         tree1 = "((en,de),(fr,es));"
         tree2 = "((en,fr),(de,es));"
         
-        with patch.object(client, '_call') as mock_call:
-            mock_call.return_value = {
-                "robinson_foulds": 2.0,
-                "normalized_rf": 0.5,
-                "max_possible_rf": 4.0,
-                "trees_identical": False
-            }
-            
-            result = client.compare_trees(tree1, tree2)
-            
-            assert isinstance(result, TreeComparison)
-            assert result.robinson_foulds == 2.0
-            assert result.normalized_rf == 0.5
-            assert result.trees_identical is False
+        mocked_client._call.return_value = {
+            "robinson_foulds": 2.0,
+            "normalized_rf": 0.5,
+            "max_possible_rf": 4.0,
+            "trees_identical": False
+        }
+        
+        result = mocked_client.compare_trees(tree1, tree2)
+        
+        assert isinstance(result, TreeComparison)
+        assert result.robinson_foulds == 2.0
+        assert result.normalized_rf == 0.5
+        assert result.trees_identical is False
 
 
 class TestPhyloService:
@@ -200,81 +265,54 @@ class TestPhyloService:
         """Test that tree inference requires R service."""
         service = PhyloService(use_r=False)
         
-        distances = np.array([[0.0, 0.3], [0.3, 0.0]])
+        distances = _D2
         labels = ["en", "de"]
         
         with pytest.raises(RuntimeError, match="R service not enabled"):
             service.infer_tree_from_distances(distances, labels)
     
-    def test_infer_tree_with_r(self):
+    def test_infer_tree_with_r(self, service_r_client, make_mock_tree):
         """Test tree inference with R enabled."""
         service = PhyloService(use_r=True)
         
-        distances = np.array([
-            [0.0, 0.3, 0.5],
-            [0.3, 0.0, 0.4],
-            [0.5, 0.4, 0.0]
-        ])
+        distances = _D3
         labels = ["en", "de", "fr"]
         
-        # Mock R client
-        with patch('backend.services.phylo.RPhyloClient') as mock_client:
-            mock_instance = MagicMock()
-            mock_client.return_value.__enter__.return_value = mock_instance
-            
-            mock_tree = PhylogeneticTree(
-                newick="((en,de),fr);",
-                method="nj",
-                n_tips=3,
-                tip_labels=labels,
-                edge_lengths=[0.15, 0.15, 0.25],
-                cophenetic_correlation=0.95,
-                rooted=False,
-                binary=True
-            )
-            mock_instance.infer_tree.return_value = mock_tree
-            
-            tree = service.infer_tree_from_distances(distances, labels, method="nj")
-            
-            assert tree.newick == "((en,de),fr);"
-            assert tree.method == "nj"
-            assert tree.cophenetic_correlation == 0.95
-            
-            # Verify call
-            mock_instance.infer_tree.assert_called_once()
+        service_r_client.infer_tree.return_value = make_mock_tree(
+            newick="((en,de),fr);",
+            n_tips=3,
+            tip_labels=labels,
+            edge_lengths=[0.15, 0.15, 0.25],
+            cophenetic_correlation=0.95
+        )
+        
+        tree = service.infer_tree_from_distances(distances, labels, method="nj")
+        
+        assert tree.newick == "((en,de),fr);"
+        assert tree.method == "nj"
+        assert tree.cophenetic_correlation == 0.95
+        
+        # Verify call
+        service_r_client.infer_tree.assert_called_once()
     
-    def test_tree_caching(self):
+    def test_tree_caching(self, service_r_client, make_mock_tree):
         """Test that trees are cached."""
         service = PhyloService(use_r=True)
         
-        distances = np.array([[0.0, 0.3], [0.3, 0.0]])
+        distances = _D2
         labels = ["en", "de"]
         
-        with patch('backend.services.phylo.RPhyloClient') as mock_client:
-            mock_instance = MagicMock()
-            mock_client.return_value.__enter__.return_value = mock_instance
-            
-            mock_tree = PhylogeneticTree(
-                newick="(en,de);",
-                method="nj",
-                n_tips=2,
-                tip_labels=labels,
-                edge_lengths=[0.15],
-                cophenetic_correlation=1.0,
-                rooted=False,
-                binary=True
-            )
-            mock_instance.infer_tree.return_value = mock_tree
-            
-            # First call - should call R
-            tree1 = service.infer_tree_from_distances(distances, labels)
-            assert mock_instance.infer_tree.call_count == 1
-            
-            # Second call - should use cache
-            tree2 = service.infer_tree_from_distances(distances, labels)
-            assert mock_instance.infer_tree.call_count == 1  # Not called again
-            
-            assert tree1.newick == tree2.newick
+        service_r_client.infer_tree.return_value = make_mock_tree()
+        
+        # First call - should call R
+        tree1 = service.infer_tree_from_distances(distances, labels)
+        assert service_r_client.infer_tree.call_count == 1
+        
+        # Second call - should use cache
+        tree2 = service.infer_tree_from_distances(distances, labels)
+        assert service_r_client.infer_tree.call_count == 1  # Not called again
+        
+        assert tree1.newick == tree2.newick
 
 
 class TestHelperFunctions:
@@ -291,48 +329,38 @@ class TestHelperFunctions:
         matrix, labels = create_distance_matrix_from_similarities(similarities)
         
         assert matrix.shape == (3, 3)
-        assert len(labels) == 3
-        assert "word1" in labels
-        assert "word2" in labels
-        assert "word3" in labels
-        
-        # Check distances (1 - similarity)
-        idx1 = labels.index("word1")
-        idx2 = labels.index("word2")
-        idx3 = labels.index("word3")
+        assert sorted(labels) == ["word1", "word2", "word3"]
         
-        assert matrix[idx1, idx2] == pytest.approx(0.2)  # 1 - 0.8
-        assert matrix[idx1, idx3] == pytest.approx(0.7)  # 1 - 0.3
-        assert matrix[idx2, idx3] == pytest.approx(0.8)  # 1 - 0.2
+        # Exactly symmetric with a zero diagonal, not just within tolerance
+        np.testing.assert_array_equal(matrix, matrix.T)
+        np.testing.assert_array_equal(np.diag(matrix), np.zeros(3))
         
-        # Matrix should be symmetric
-        assert matrix[idx1, idx2] == matrix[idx2, idx1]
+        # Distances are 1 - similarity; build the symmetric, zero-diagonal
+        # matrix from its condensed upper triangle, as squareform would
+        expected = np.zeros((3, 3))
+        expected[np.triu_indices(3, k=1)] = [0.2, 0.7, 0.8]
+        expected += expected.T
         
-        # Diagonal should be zero
-        assert matrix[idx1, idx1] == 0.0
+        order = [labels.index(w) for w in ("word1", "word2", "word3")]
+        np.testing.assert_allclose(matrix[np.ix_(order, order)], expected, atol=1e-9)
 
 
 @pytest.mark.integration
-@pytest.mark.skipif(True, reason="Requires R service running")
+@pytest.mark.skipif(
+    not os.getenv("RUN_R_INTEGRATION"),
+    reason="Requires R service running (set RUN_R_INTEGRATION=1)"
+)
 class TestRServiceIntegration:
     """Integration tests requiring actual R service.
     
     To run: 
     1. Start R service: cd services/phylo-r && Rscript server.R
-    2. Run: pytest tests/test_r_integration.py::TestRServiceIntegration -v
+    2. Run: RUN_R_INTEGRATION=1 pytest tests/test_r_integration.py::TestRServiceIntegration -v
     """
     
     def test_real_tree_inference(self):
         """Test actual tree inference with R service."""
-        # Indo-European language distances (simplified)
-        distances = np.array([
-            [0.0, 0.25, 0.50, 0.60, 0.70],  # English
-            [0.25, 0.0, 0.45, 0.55, 0.65],  # German
-            [0.50, 0.45, 0.0, 0.30, 0.40],  # French
-            [0.60, 0.55, 0.30, 0.0, 0.35],  # Spanish
-            [0.70, 0.65, 0.40, 0.35, 0.0]   # Italian
-        ])
-        
+        distances = _D5_INDO_EUROPEAN
         labels = ["English", "German", "French", "Spanish", "Italian"]
         
         with RPhyloClient() as client:
@@ -352,14 +380,7 @@ class TestRServiceIntegration:
     
     def test_real_hierarchical_clustering(self):
         """Test actual hierarchical clustering."""
-        # Cognate distances
-        distances = np.array([
-            [0.0, 0.1, 0.8, 0.9],
-            [0.1, 0.0, 0.7, 0.8],
-            [0.8, 0.7, 0.0, 0.1],
-            [0.9, 0.8, 0.1, 0.0]
-        ])
-        
+        distances = _D4_COGNATES
         labels = ["water_en", "wasser_de", "eau_fr", "agua_es"]
         
         with RPhyloClient() as client:
@@ -0,0 +1,240 @@
+"""Test suite for streaming utilities."""
+
+import asyncio
+import gzip
+import os
+
+import pytest
+from backend.storage import stream
+from backend.storage.stream import (
+    Checkpoint,
+    JsonlSource,
+    deduplicate,
+    map_concurrent,
+    map_concurrent_unordered,
+    sliding_window,
+    sliding_window_view,
+    stream_jsonl,
+    stream_jsonl_sync,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+JSONL = b'{"id": 1}\n\n{"id": 2, "tags": ["a"]}\n   \n{"id": 3}'
+
+# Big and varied enough that its gzip index is smaller than the file
+LARGE_IDS = list(range(0, 200_000, 97))
+LARGE_JSONL = b"".join(b'{"id": %d, "h": "%x"}\n' % (i, i * 2654435761) for i in LARGE_IDS)
+
+
+def collect(filepath, **kwargs):
+    """Drain stream_jsonl into a list of batches."""
+    async def run():
+        return [batch async for batch in stream_jsonl(filepath, **kwargs)]
+    return asyncio.run(run())
+
+
+class TestStreamJsonl:
+    """Test batched JSONL parsing."""
+
+    @pytest.fixture
+    def jsonl_path(self, tmp_path):
+        path = tmp_path / "entries.jsonl"
+        path.write_bytes(JSONL)
+        return path
+
+    def test_batches(self, jsonl_path):
+        batches = collect(jsonl_path, batch_size=3)
+
+        assert batches == [[{"id": 1}, {"id": 2, "tags": ["a"]}], [{"id": 3}]]
+
+    def test_parallel_workers_keep_order(self, tmp_path):
+        path = tmp_path / "entries.jsonl"
+        path.write_bytes(b"".join(b'{"id": %d}\n' % i for i in range(100)) + b"{oops\n")
+
+        batches = collect(path, batch_size=7, workers=3)
+
+        assert [e["id"] for batch in batches for e in batch] == list(range(100))
+
+    def test_accepts_source(self, tmp_path):
+        path = tmp_path / "entries.jsonl.gz"
+        path.write_bytes(gzip.compress(JSONL))
+
+        source = JsonlSource.from_path(path)
+
+        assert source.is_gz and source.size == path.stat().st_size
+        assert collect(source) == [[{"id": 1}, {"id": 2, "tags": ["a"]}, {"id": 3}]]
+
+    def test_empty_file(self, tmp_path):
+        path = tmp_path / "empty.jsonl"
+        path.write_bytes(b"")
+
+        assert collect(path) == []
+        assert list(stream_jsonl_sync(path)) == []
+
+    @pytest.mark.parametrize("parallel", [True, False])
+    def test_gzip(self, tmp_path, monkeypatch, parallel):
+        if parallel:
+            pytest.importorskip("rapidgzip")
+        else:
+            monkeypatch.setattr(stream, "RAPIDGZIP_AVAILABLE", False)
+
+        path = tmp_path / "entries.jsonl.gz"
+        path.write_bytes(gzip.compress(LARGE_JSONL))
+
+        # Second pass reuses the rapidgzip index written by the first
+        for _ in range(2):
+            assert [e["id"] for e in stream_jsonl_sync(path)] == LARGE_IDS
+        assert (tmp_path / "entries.jsonl.gz.gzindex").exists() == parallel
+
+    def test_gzip_index_survives_replaced_file(self, tmp_path):
+        pytest.importorskip("rapidgzip")
+        path = tmp_path / "entries.jsonl.gz"
+        path.write_bytes(gzip.compress(LARGE_JSONL))
+        list(stream_jsonl_sync(path))
+        mtime = path.stat().st_mtime_ns
+
+        # Swapped in with the old mtime preserved, as cp -p would
+        path.write_bytes(gzip.compress(JSONL))
+        os.utime(path, ns=(mtime, mtime))
+
+        for _ in range(2):
+            assert [e["id"] for e in stream_jsonl_sync(path)] == [1, 2, 3]
+
+    def test_gzip_index_not_larger_than_file(self, tmp_path):
+        pytest.importorskip("rapidgzip")
+        path = tmp_path / "entries.jsonl.gz"
+        path.write_bytes(gzip.compress(JSONL))
+
+        assert [e["id"] for e in stream_jsonl_sync(path)] == [1, 2, 3]
+        assert not (tmp_path / "entries.jsonl.gz.gzindex").exists()
+
+    @pytest.mark.parametrize("bad_line", [b"{oops", b"1, 2", b'{"id": 9', b'"id": 9}'])
+    def test_skips_malformed_line(self, tmp_path, bad_line):
+        path = tmp_path / "entries.jsonl"
+        path.write_bytes(b'{"id": 1}\n' + bad_line + b'\n{"id": 2}\n')
+
+        assert collect(path) == [[{"id": 1}, {"id": 2}]]
+        assert list(stream_jsonl_sync(path)) == [{"id": 1}, {"id": 2}]
+
+    def test_reports_malformed_line_number(self, tmp_path):
+        path = tmp_path / "entries.jsonl"
+        path.write_bytes(b'{"id": 1}\n\n{oops\n')
+
+        with pytest.raises(ValueError, match="line 3"):
+            list(stream_jsonl_sync(path, skip_errors=False, batch_size=2))
+
+    def test_does_not_merge_malformed_lines(self, tmp_path):
+        # Neither line is valid JSON alone, but joined they would read
+        # as two string records
+        path = tmp_path / "entries.jsonl"
+        path.write_bytes(b'{"id": 1}\n"a\nb"],["c\n{"id": 2}\n')
+
+        assert list(stream_jsonl_sync(path)) == [{"id": 1}, {"id": 2}]
+
+
+class TestCheckpoint:
+    """Test resumable checkpoints."""
+
+    @pytest.mark.parametrize("roaring", [True, False])
+    def test_resume(self, tmp_path, monkeypatch, roaring):
+        if roaring:
+            pytest.importorskip("pyroaring")
+        else:
+            monkeypatch.setattr(stream, "PYROARING_AVAILABLE", False)
+
+        path = tmp_path / "ckpt" / "progress.json"
+        checkpoint = Checkpoint(path)
+        checkpoint.mark_processed("a")
+        checkpoint.save()
+        checkpoint.mark_processed("b")
+        checkpoint.mark_processed("a")
+        checkpoint.save()
+
+        resumed = Checkpoint(path)
+        assert resumed.is_processed("a") and resumed.is_processed("b")
+        assert not resumed.is_processed("c")
+
+    def test_reads_legacy_json(self, tmp_path):
+        path = tmp_path / "progress.json"
+        path.write_bytes(b'["a", "b"]')
+
+        checkpoint = Checkpoint(path)
+
+        assert checkpoint.is_processed("b") and not checkpoint.is_processed("c")
+
+    def test_ignores_torn_record(self, tmp_path):
+        path = tmp_path / "progress.json"
+        checkpoint = Checkpoint(path)
+        checkpoint.mark_processed("a")
+        checkpoint.save()
+
+        with open(checkpoint._log_path, "ab") as f:
+            f.write(b"\x01\x02\x03")
+
+        assert Checkpoint(path).is_processed("a")
+
+
+class TestMapConcurrent:
+    """Test bounded concurrent mapping."""
+
+    @staticmethod
+    def run(mapper, values, **kwargs):
+        async def source():
+            for value in values:
+                yield value
+
+        async def slow_square(value):
+            # Earlier items finish last
+            await asyncio.sleep(0.001 * (len(values) - value))
+            return value * value
+
+        async def main():
+            return [r async for r in mapper(source(), slow_square, **kwargs)]
+
+        return asyncio.run(main())
+
+    def test_ordered(self):
+        assert self.run(map_concurrent, list(range(20)), max_concurrency=4) == [
+            v * v for v in range(20)
+        ]
+
+    def test_unordered(self):
+        results = self.run(map_concurrent_unordered, list(range(20)), max_concurrency=4)
+
+        assert sorted(results) == [v * v for v in range(20)]
+
+
+class TestSlidingWindow:
+    """Test sliding windows."""
+
+    @pytest.mark.parametrize("values, expected", [
+        ([1, 2, 3, 4], [(1, 2), (2, 3), (3, 4)]),
+        ([1, 2], [(1, 2)]),
+        ([1], []),
+    ])
+    def test_windows(self, values, expected):
+        assert list(sliding_window(iter(values), 2)) == expected
+        assert sliding_window_view(values, 2).tolist() == [list(w) for w in expected]
+
+
+class TestDeduplicate:
+    """Test stream deduplication."""
+
+    @pytest.mark.parametrize("roaring", [True, False])
+    def test_keeps_first_occurrence(self, monkeypatch, roaring):
+        if roaring:
+            pytest.importorskip("pyroaring")
+        else:
+            monkeypatch.setattr(stream, "PYROARING_AVAILABLE", False)
+
+        async def source():
+            for item in [("a", 1), ("b", 2), ("a", 3), ("c", 4), ("b", 5)]:
+                yield item
+
+        async def main():
+            return [item async for item in deduplicate(source(), lambda i: i[0])]
+
+        assert asyncio.run(main()) == [("a", 1), ("b", 2), ("c", 4)]
@@ -0,0 +1,91 @@
+"""Test suite for entry validators."""
+
+import pytest
+from backend.core.types import Entry
+from backend.storage.validators import (
+    EntryValidator,
+    IPAValidator,
+    LanguageCodeValidator,
+    MaxLength,
+    MinLength,
+    RegexMatch,
+    RequiredField,
+    ValidatorFactory,
+    compute_quality_score,
+    compute_quality_score_batch,
+)
+
+
+pytestmark = pytest.mark.unit
+
+
+def make_entry(id: str, **fields) -> Entry:
+    """Build an entry with valid defaults for unspecified fields."""
+    defaults = dict(headword="water", ipa="ˈwɔːtər", language="en", definition="clear liquid")
+    return Entry(id=id, **{**defaults, **fields})
+
+
+IPAS = ["ˈwɔːtər", "", "  ", "ta1", "taː1", "[ta", "[ta]", "e̯2", "é3"]
+
+
+class TestEntryValidator:
+    """Test batch validation paths against per-entry validation."""
+
+    def test_batch_ipa_matches_rule(self):
+        rule = IPAValidator()
+        expected = [rule(make_entry(str(i), ipa=ipa)) for i, ipa in enumerate(IPAS)]
+
+        assert EntryValidator.batch_validate_ipa(IPAS) == expected
+
+    @pytest.mark.parametrize("factory", [
+        ValidatorFactory.standard_entry_validator,
+        ValidatorFactory.permissive_entry_validator,
+    ])
+    def test_batch_matches_validate(self, factory):
+        validator = factory()
+        entries = [make_entry(str(i), ipa=ipa) for i, ipa in enumerate(IPAS)]
+        entries.append(make_entry("bad-lang", language="xx", headword=" "))
+
+        expected = {}
+        for entry in entries:
+            is_valid, errors = validator.validate(entry)
+            if not is_valid:
+                expected[entry.id] = errors
+
+        assert validator.batch_validate(entries) == expected
+
+    def test_fused_matches_rules(self):
+        rules = [
+            RequiredField('headword'),
+            RequiredField('etymology'),
+            RequiredField('not_a_field'),
+            MinLength('definition', 5),
+            MaxLength('headword', 3),
+            RegexMatch('language', r'^[a-z]{2}$', "must be a two-letter code"),
+            IPAValidator(),
+            LanguageCodeValidator(),
+            lambda entry: (entry.id != "2", "custom rule failed"),
+        ]
+        validator = EntryValidator(rules)
+
+        for i, ipa in enumerate(IPAS):
+            entry = make_entry(str(i), ipa=ipa, language="EN" if i % 2 else "grc")
+            expected = [error for ok, error in (rule(entry) for rule in rules) if not ok]
+
+            assert validator.validate(entry) == (not expected, expected)
+
+    def test_quality_score_batch_matches_scalar(self):
+        validator = ValidatorFactory.standard_entry_validator()
+        entries = [make_entry(str(i), ipa=ipa, definition="w") for i, ipa in enumerate(IPAS)]
+
+        scores = compute_quality_score_batch(entries, validator)
+
+        assert scores.tolist() == [compute_quality_score(e, validator) for e in entries]
+
+    def test_fused_reuses_rule_messages(self):
+        rule = RequiredField('headword')
+        validator = EntryValidator([rule])
+
+        _, errors = validator.validate(make_entry("1", headword=" "))
+
+        assert errors[0] is rule(make_entry("2", headword=""))[1]